@@ -1,5 +1,8 @@
 import sys
 import os
+import re
+import bisect
+from itertools import accumulate
 import pandas as pd
 from PyQt6.QtWidgets import QApplication, QWidget, QPushButton, QFileDialog, QVBoxLayout, QLabel, QLineEdit, \
     QHBoxLayout, QMessageBox, QFrame
@@ -17,6 +20,13 @@ import hashlib
 import json
 from datetime import datetime, timedelta
 
+try:
+    import pyarrow  # noqa: F401 - only needed for Arrow-backed string columns
+    # Arrow strings are one UTF-8 buffer; lower() and contains() run as Arrow kernels
+    NAME_DTYPE = 'string[pyarrow]'
+except ImportError:
+    NAME_DTYPE = object
+
 
 class DatabaseCache:
     """Handles caching of loaded Excel/SQL databases to reduce loading time"""
@@ -91,24 +101,29 @@ class DatabaseCache:
             return False
     
     def load_from_cache(self, file_path):
-        """Load dataframe from cache"""
+        """Load dataframe and its lower-cased eNodeB names from cache
+        
+        The names are None for caches written before they were stored alongside the dataframe.
+        """
         cache_file, metadata_file = self._get_cache_path(file_path)
         
         try:
             with open(cache_file, 'rb') as f:
-                df = pickle.load(f)
-            return df
+                cached = pickle.load(f)
+            if isinstance(cached, pd.DataFrame):
+                return cached, None
+            return cached
         except Exception:
-            return None
+            return None, None
     
-    def save_to_cache(self, file_path, df):
-        """Save dataframe to cache with metadata"""
+    def save_to_cache(self, file_path, df, enodeb_names_lower=None):
+        """Save dataframe (and its lower-cased eNodeB names) to cache with metadata"""
         cache_file, metadata_file = self._get_cache_path(file_path)
         
         try:
-            # Save dataframe as pickle
+            # Save dataframe and names together as one pickle
             with open(cache_file, 'wb') as f:
-                pickle.dump(df, f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump((df, enodeb_names_lower), f, protocol=pickle.HIGHEST_PROTOCOL)
             
             # Save metadata
             metadata = {
@@ -452,12 +467,59 @@ class GSMProcessorThread(QThread):
             import traceback
             print(f"GSM Error details: {traceback.format_exc()}")
 
+class DatabaseLoadThread(QThread):
+    progress_signal = pyqtSignal(str)
+    finished_signal = pyqtSignal(bool, str)
+    loaded_signal = pyqtSignal(object, object)
+    
+    def __init__(self, file_path, db_cache):
+        super().__init__()
+        self.file_path = file_path
+        self.db_cache = db_cache
+    
+    def index_enodeb_names(self, df):
+        """Precompute the lower-cased eNodeB names every extraction matches against"""
+        df['eNodeB Name'] = df['eNodeB Name'].astype(str)
+        return df['eNodeB Name'].astype(NAME_DTYPE).str.lower()
+    
+    def run(self):
+        try:
+            # Try to load from cache first
+            if self.db_cache.is_cache_valid(self.file_path):
+                self.progress_signal.emit("📦 Loading from cache...")
+                df, enodeb_names_lower = self.db_cache.load_from_cache(self.file_path)
+                
+                if df is not None and 'eNodeB Name' in df.columns:
+                    if enodeb_names_lower is None:
+                        enodeb_names_lower = self.index_enodeb_names(df)
+                    self.loaded_signal.emit(df, enodeb_names_lower)
+                    cache_info = self.db_cache.get_cache_info(self.file_path)
+                    age_text = f"({cache_info['cache_age_hours']:.1f}h old)" if cache_info else ""
+                    self.finished_signal.emit(True, f'File loaded from cache {age_text}. Enter eNodeB name and click Extract.')
+                    return
+            
+            # Load from Excel file if cache is not valid
+            self.progress_signal.emit("📊 Loading Excel file...")
+            df = pd.read_excel(self.file_path)
+            if 'eNodeB Name' in df.columns:
+                enodeb_names_lower = self.index_enodeb_names(df)
+                # Save to cache (names included) for future use
+                self.progress_signal.emit("💾 Caching database for faster future loads...")
+                self.db_cache.save_to_cache(self.file_path, df, enodeb_names_lower)
+                self.loaded_signal.emit(df, enodeb_names_lower)
+                self.finished_signal.emit(True, 'File loaded successfully (cached). Enter eNodeB name and click Extract.')
+            else:
+                self.finished_signal.emit(False, 'Fadzli Abdullah: No "eNodeB Name" column found.')
+        except Exception as e:
+            self.finished_signal.emit(False, f'Fadzli Abdullah: {str(e)}')
+
 class ExcelFilterApp(QWidget):
     def __init__(self):
         super().__init__()
         self.start_time = QElapsedTimer()
         self.start_time.start()
         self.gsm_thread = None
+        self.load_thread = None
         
         # Initialize database cache
         self.db_cache = DatabaseCache()
@@ -830,6 +892,7 @@ class ExcelFilterApp(QWidget):
 
         # Initialize properties
         self.df = None
+        self.enodeb_names_lower = None  # Lower-cased 'eNodeB Name' column, built once per load
         self.file_path = None
         self.output_folder = None
         self.filtered_df = None
@@ -890,55 +953,36 @@ class ExcelFilterApp(QWidget):
                 self.label.setText(f'Loading from cache ({cache_info["cache_age_hours"]:.1f}h old)...')
             else:
                 self.label.setText('Loading file. Please wait.')
-            QApplication.processEvents()
-            QTimer.singleShot(100, self.loadFile)
+            self.loadFile()
 
     def loadFile(self):
-        try:
-            # Try to load from cache first
-            if self.db_cache.is_cache_valid(self.file_path):
-                self.show_progress("📦 Loading from cache...")
-                self.df = self.db_cache.load_from_cache(self.file_path)
-                
-                if self.df is not None and 'eNodeB Name' in self.df.columns:
-                    cache_info = self.db_cache.get_cache_info(self.file_path)
-                    age_text = f"({cache_info['cache_age_hours']:.1f}h old)" if cache_info else ""
-                    self.label.setText(f'File loaded from cache {age_text}. Enter eNodeB name and click Extract.')
-                    self.hide_progress()
-                    self.output_folder = os.path.dirname(self.file_path)
-                    self.step1_number.setActive(False)
-                    self.step2_number.setActive(True)
-                    self.filter_input.setEnabled(True)
-                    self.filter_input.clear()
-                    for i in range(3, 8):
-                        getattr(self, f'step{i}_number').setActive(False)
-                    return
-            
-            # Load from Excel file if cache is not valid
-            self.show_progress("📊 Loading Excel file...")
-            self.df = pd.read_excel(self.file_path)
-            if 'eNodeB Name' in self.df.columns:
-                # Save to cache for future use
-                self.show_progress("💾 Caching database for faster future loads...")
-                self.db_cache.save_to_cache(self.file_path, self.df)
-                
-                self.label.setText('File loaded successfully (cached). Enter eNodeB name and click Extract.')
-                self.hide_progress()
-                self.output_folder = os.path.dirname(self.file_path)
-                self.step1_number.setActive(False)
-                self.step2_number.setActive(True)
-                self.filter_input.setEnabled(True)
-                self.filter_input.clear()
-                for i in range(3, 8):
-                    getattr(self, f'step{i}_number').setActive(False)
-            else:
-                self.hide_progress()
-                self.label.setText('Fadzli Abdullah: No "eNodeB Name" column found.')
-                self.df = None
-        except Exception as e:
-            self.hide_progress()
-            self.label.setText(f'Fadzli Abdullah: {str(e)}')
+        # Read and index the database off the UI thread
+        self.btn.setEnabled(False)
+        self.load_thread = DatabaseLoadThread(self.file_path, self.db_cache)
+        self.load_thread.progress_signal.connect(self.show_progress)
+        self.load_thread.loaded_signal.connect(self.database_loaded)
+        self.load_thread.finished_signal.connect(self.load_completed)
+        self.load_thread.start()
+
+    def database_loaded(self, df, enodeb_names_lower):
+        self.df = df
+        self.enodeb_names_lower = enodeb_names_lower
+
+    def load_completed(self, success, message):
+        self.hide_progress()
+        self.btn.setEnabled(True)
+        self.label.setText(message)
+        if success:
+            self.output_folder = os.path.dirname(self.file_path)
+            self.step1_number.setActive(False)
+            self.step2_number.setActive(True)
+            self.filter_input.setEnabled(True)
+            self.filter_input.clear()
+            for i in range(3, 8):
+                getattr(self, f'step{i}_number').setActive(False)
+        else:
             self.df = None
+            self.enodeb_names_lower = None
 
     def onFilterTextChanged(self, text):
         cursor_position = self.filter_input.cursorPosition()
@@ -1035,16 +1079,26 @@ class ExcelFilterApp(QWidget):
             self.show_progress("🔍 Filtering eNodeB data...")
             
             enodeb_names = [name.strip().lower() for name in requested_enodebs]
-            self.df['eNodeB Name'] = self.df['eNodeB Name'].astype(str)
             
-            mask = self.df['eNodeB Name'].str.lower().apply(
-                lambda x: any(
-                    (name in x and 
-                    (x.startswith(name) or x.endswith(name) or f"_{name}_" in f"_{x}_"))
-                    for name in enodeb_names
-                )
+            # A name matches at the start or end of the eNodeB name, or as a whole
+            # '_'-separated part; one alternation tests every requested name in a single pass
+            alternation = '|'.join(re.escape(name) for name in enodeb_names)
+            mask = self.enodeb_names_lower.str.contains(
+                f'^(?:{alternation})|(?:{alternation})$|_(?:{alternation})_', regex=True, na=False
             )
             self.filtered_df = self.df[mask]
+            # Lower-cased names of the filtered rows joined into one string, so each requested
+            # name is a single str.find that stops at the first hit; name_starts maps the hit
+            # offset back to its row
+            filtered_names_lower = self.enodeb_names_lower[mask].tolist()
+            names_blob = '\x1f'.join(filtered_names_lower)
+            name_starts = list(accumulate((len(n) + 1 for n in filtered_names_lower[:-1]), initial=0))
+
+            # Column positions for reading single cells with .iat (Sub Region is column 46)
+            columns = self.filtered_df.columns
+            enodeb_id_col = columns.get_loc('eNodeBID') if 'eNodeBID' in columns else None
+            tac_col = columns.get_loc('TAC') if 'TAC' in columns else None
+            sub_region_col = 45 if len(columns) > 45 else None
 
             # Initialize lists to store IDs and regions in order
             enodeb_ids = []
@@ -1052,14 +1106,15 @@ class ExcelFilterApp(QWidget):
             sub_regions = []
             
             for name in enodeb_names:
-                matches = self.filtered_df[self.filtered_df['eNodeB Name'].str.lower().str.contains(name)]
-                if not matches.empty:
-                    first_match = matches.iloc[0]
-                    enodeb_id = str(int(float(first_match['eNodeBID']))) if 'eNodeBID' in self.filtered_df.columns else 'N/A'
+                # Only the first match is used
+                position = names_blob.find(name)
+                if position >= 0:
+                    row = bisect.bisect_right(name_starts, position) - 1
+                    enodeb_id = str(int(float(self.filtered_df.iat[row, enodeb_id_col]))) if enodeb_id_col is not None else 'N/A'
                     enodeb_ids.append(enodeb_id)
-                    tac = str(int(float(first_match['TAC']))) if 'TAC' in self.filtered_df.columns else 'N/A'
+                    tac = str(int(float(self.filtered_df.iat[row, tac_col]))) if tac_col is not None else 'N/A'
                     tacs.append(tac)
-                    sub_regions.append(str(first_match.iloc[45]) if len(first_match) > 45 else 'N/A')
+                    sub_regions.append(str(self.filtered_df.iat[row, sub_region_col]) if sub_region_col is not None else 'N/A')
                 else:
                     enodeb_ids.append("N/A")
                     tacs.append("N/A")
@@ -6,6 +6,8 @@ from matplotlib.figure import Figure
 import numpy as np
 import json
 import math
+import traceback
+from dataclasses import dataclass, asdict
 
 
 # ==============================================
@@ -34,23 +36,20 @@ class Antenna:
         self.polarization = polarization
 
 
+@dataclass(slots=True)
 class SiteConfiguration:
     """Site configuration model"""
 
-    def __init__(self, site_id="SITE001", latitude=0.0, longitude=0.0,
-                 antenna_height=30.0, azimuth=0.0, mechanical_tilt=0.0,
-                 electrical_tilt=0.0, antenna_type="Kathrein 80010638",
-                 frequency=900.0, power=43.0):
-        self.site_id = site_id
-        self.latitude = latitude
-        self.longitude = longitude
-        self.antenna_height = antenna_height  # meters
-        self.azimuth = azimuth  # degrees
-        self.mechanical_tilt = mechanical_tilt  # degrees
-        self.electrical_tilt = electrical_tilt  # degrees
-        self.antenna_type = antenna_type
-        self.frequency = frequency  # MHz
-        self.power = power  # dBm
+    site_id: str = "SITE001"
+    latitude: float = 0.0
+    longitude: float = 0.0
+    antenna_height: float = 30.0  # meters
+    azimuth: float = 0.0  # degrees
+    mechanical_tilt: float = 0.0  # degrees
+    electrical_tilt: float = 0.0  # degrees
+    antenna_type: str = "Kathrein 80010638"
+    frequency: float = 900.0  # MHz
+    power: float = 43.0  # dBm
 
 
 # ==============================================
@@ -141,6 +140,7 @@ class AntennaDatabase:
             "CommScope": []
         }
         self._categorize_antennas()
+        self._build_search_arrays()
 
     def _load_default_antennas(self):
         """Load default antenna patterns"""
@@ -229,6 +229,15 @@ class AntennaDatabase:
             if antenna.manufacturer in self.categories:
                 self.categories[antenna.manufacturer].append(antenna.name)
 
+    def _build_search_arrays(self):
+        """Build parallel arrays of searchable antenna attributes"""
+        self._freq_lows = np.array([a.frequency_range[0] for a in self.antennas], dtype=np.float64)
+        self._freq_highs = np.array([a.frequency_range[1] for a in self.antennas], dtype=np.float64)
+        self._gains = np.array([a.gain for a in self.antennas], dtype=np.float64)
+        self._hbws = np.array([a.horizontal_bw for a in self.antennas], dtype=np.float64)
+        self._antenna_objs = np.empty(len(self.antennas), dtype=object)
+        self._antenna_objs[:] = self.antennas
+
     def get_antenna_by_name(self, name: str):
         """Get antenna by name"""
         for antenna in self.antennas:
@@ -244,26 +253,18 @@ class AntennaDatabase:
                         min_gain: float = None,
                         max_hbw: float = None):
         """Search antennas based on criteria"""
-        results = []
-        for antenna in self.antennas:
-            match = True
-
-            if frequency:
-                if not (antenna.frequency_range[0] <= frequency <= antenna.frequency_range[1]):
-                    match = False
+        mask = np.ones(len(self._antenna_objs), dtype=bool)
 
-            if min_gain:
-                if antenna.gain < min_gain:
-                    match = False
+        if frequency:
+            mask &= (self._freq_lows <= frequency) & (self._freq_highs >= frequency)
 
-            if max_hbw:
-                if antenna.horizontal_bw > max_hbw:
-                    match = False
+        if min_gain:
+            mask &= self._gains >= min_gain
 
-            if match:
-                results.append(antenna)
+        if max_hbw:
+            mask &= self._hbws <= max_hbw
 
-        return results
+        return self._antenna_objs[mask].tolist()
 
 
 # ==============================================
@@ -273,6 +274,10 @@ class AntennaDatabase:
 class KathreinCalculatorApp:
     """Main application window"""
 
+    # Results panel banner, built once instead of on every add_to_results call
+    _SEP = "=" * 60
+    _BANNER = f"\n{_SEP}\n{{title}}\n{_SEP}\n{{content}}\n"
+
     def __init__(self, root):
         self.root = root
         self.root.title("RF Antenna Calculator - Fadzli Edition")
@@ -290,6 +295,10 @@ class KathreinCalculatorApp:
         # Initialize widgets dictionary
         self.widgets = {}
 
+        # Numeric entry validation and single handler for callback failures
+        self._float_vcmd = (self.root.register(self._is_float), '%P')
+        self.root.report_callback_exception = self._report_callback_exception
+
         # Build UI
         self.setup_ui()
 
@@ -325,6 +334,9 @@ class KathreinCalculatorApp:
         # Status bar (pack after footer so it appears above)
         self.setup_status_bar()
 
+        # Non-modal result panel for quick calculations
+        self.setup_info_panel()
+
     def build_control_panel(self, parent):
         """Build the control panel with input fields"""
         # Notebook for tabs
@@ -475,7 +487,8 @@ class KathreinCalculatorApp:
         # Search criteria
         ttk.Label(parent, text="Search by Frequency (MHz):").grid(row=4, column=0, sticky=tk.W, pady=5)
         self.search_freq_var = tk.DoubleVar(value=900)
-        ttk.Entry(parent, textvariable=self.search_freq_var, width=15).grid(row=4, column=1, pady=5, padx=5)
+        ttk.Entry(parent, textvariable=self.search_freq_var, width=15,
+                  validate='key', validatecommand=self._float_vcmd).grid(row=4, column=1, pady=5, padx=5)
 
         ttk.Button(parent, text="Search Antennas",
                    command=self.search_antennas).grid(row=4, column=2, pady=5, padx=5)
@@ -550,7 +563,8 @@ class KathreinCalculatorApp:
 
         ttk.Label(conv_frame, text="dBm to Watts:").grid(row=0, column=0, sticky=tk.W)
         self.dbm_var = tk.DoubleVar(value=30.0)
-        ttk.Entry(conv_frame, textvariable=self.dbm_var, width=10).grid(row=0, column=1, padx=5)
+        ttk.Entry(conv_frame, textvariable=self.dbm_var, width=10,
+                  validate='key', validatecommand=self._float_vcmd).grid(row=0, column=1, padx=5)
         ttk.Button(conv_frame, text="Convert",
                    command=lambda: self.convert_units('dbm_to_watts')).grid(row=0, column=2, padx=5)
         self.watts_result = ttk.Label(conv_frame, text="")
@@ -558,7 +572,8 @@ class KathreinCalculatorApp:
 
         ttk.Label(conv_frame, text="Watts to dBm:").grid(row=1, column=0, sticky=tk.W)
         self.watts_in_var = tk.DoubleVar(value=1.0)
-        ttk.Entry(conv_frame, textvariable=self.watts_in_var, width=10).grid(row=1, column=1, padx=5)
+        ttk.Entry(conv_frame, textvariable=self.watts_in_var, width=10,
+                  validate='key', validatecommand=self._float_vcmd).grid(row=1, column=1, padx=5)
         ttk.Button(conv_frame, text="Convert",
                    command=lambda: self.convert_units('watts_to_dbm')).grid(row=1, column=2, padx=5)
         self.dbm_result = ttk.Label(conv_frame, text="")
@@ -600,8 +615,12 @@ class KathreinCalculatorApp:
         self.fig_pattern = Figure(figsize=(8, 6), dpi=100)
         self.ax_pattern = self.fig_pattern.add_subplot(111, projection='polar')
 
+        self._pattern_bbox = None  # tight bbox in inches, refreshed on each redraw
+
         self.canvas_pattern = FigureCanvasTkAgg(self.fig_pattern, pattern_frame)
         self.canvas_pattern.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        # A resize changes the figure size, so the measured bbox no longer applies
+        self.canvas_pattern.mpl_connect('resize_event', self._invalidate_pattern_bbox)
 
         # Add toolbar
         toolbar_frame = ttk.Frame(pattern_frame)
@@ -650,6 +669,39 @@ class KathreinCalculatorApp:
         version_label = ttk.Label(status_bar, text="RF Antenna Calculator v1.0 - Fadzli Edition")
         version_label.pack(side=tk.RIGHT, padx=5)
 
+    def setup_info_panel(self):
+        """Setup reusable non-modal window for showing the last result"""
+        self._info_panel = tk.Toplevel(self.root)
+        self._info_panel.withdraw()
+        self._info_panel.transient(self.root)
+        self._info_panel.protocol("WM_DELETE_WINDOW", self._info_panel.withdraw)
+
+        self._info_var = tk.StringVar()
+        ttk.Label(self._info_panel, textvariable=self._info_var,
+                  justify=tk.LEFT, padding=15).pack(fill=tk.BOTH, expand=True)
+        ttk.Button(self._info_panel, text="Close",
+                   command=self._info_panel.withdraw).pack(pady=(0, 10))
+
+    @staticmethod
+    def _is_float(text):
+        """Entry validatecommand: accept numbers, including partial input while typing"""
+        return text.removeprefix('-').replace('.', '', 1).isdigit() or text in ("", "-", ".", "-.")
+
+    def _report_callback_exception(self, exc_type, exc_value, exc_tb):
+        """Log uncaught Tk callback errors and show them in a dialog"""
+        traceback.print_exception(exc_type, exc_value, exc_tb)
+        if issubclass(exc_type, tk.TclError):
+            # A DoubleVar read from an empty or partial entry ("", "-", ".")
+            messagebox.showerror("Invalid Input", "Please enter a number in every field.")
+        else:
+            messagebox.showerror("Error", f"Operation failed: {exc_value}")
+
+    def _show_info(self, title, message):
+        """Show a result in the info panel without blocking the event loop"""
+        self._info_var.set(message)
+        self._info_panel.title(title)
+        self._info_panel.deiconify()
+
     # ==============================================
     # EVENT HANDLERS
     # ==============================================
@@ -788,6 +840,15 @@ Polarization: {antenna.polarization}
 
         self.canvas_pattern.draw()
 
+        # Measure the tight bbox from this draw so save_pattern can skip the extra layout pass
+        renderer = self.canvas_pattern.get_renderer()
+        self._pattern_bbox = self.fig_pattern.get_tightbbox(renderer).transformed(
+            self.fig_pattern.dpi_scale_trans.inverted()).padded(0.1)
+
+    def _invalidate_pattern_bbox(self, event):
+        """Forget the measured pattern bbox; save_pattern uses 'tight' until the next redraw"""
+        self._pattern_bbox = None
+
     def update_site_view(self):
         """Update site visualization"""
         self.ax_site.clear()
@@ -951,21 +1012,22 @@ Polarization: {antenna.polarization}
 
     def convert_units(self, conversion_type):
         """Handle unit conversions"""
-        try:
-            if conversion_type == 'dbm_to_watts':
-                watts = self.rf_calc.dbm_to_watts(self.dbm_var.get())
-                self.watts_result.config(text=f"{watts:.6f} W")
-                self.add_to_results("Unit Conversion",
-                                    f"{self.dbm_var.get():.2f} dBm = {watts:.6f} W")
-
-            elif conversion_type == 'watts_to_dbm':
-                dbm = self.rf_calc.watts_to_dbm(self.watts_in_var.get())
-                self.dbm_result.config(text=f"{dbm:.2f} dBm")
-                self.add_to_results("Unit Conversion",
-                                    f"{self.watts_in_var.get():.6f} W = {dbm:.2f} dBm")
-
-        except Exception as e:
-            messagebox.showerror("Error", f"Conversion failed: {str(e)}")
+        if conversion_type == 'dbm_to_watts':
+            dbm = self.dbm_var.get()
+            watts = self.rf_calc.dbm_to_watts(dbm)
+            self.watts_result.config(text=f"{watts:.6f} W")
+            self.add_to_results("Unit Conversion",
+                                f"{dbm:.2f} dBm = {watts:.6f} W")
+
+        elif conversion_type == 'watts_to_dbm':
+            watts = self.watts_in_var.get()
+            if watts <= 0:
+                messagebox.showerror("Error", "Conversion failed: power must be greater than 0 W")
+                return
+            dbm = self.rf_calc.watts_to_dbm(watts)
+            self.dbm_result.config(text=f"{dbm:.2f} dBm")
+            self.add_to_results("Unit Conversion",
+                                f"{watts:.6f} W = {dbm:.2f} dBm")
 
     def calculate_total_tilt(self):
         """Calculate total tilt"""
@@ -974,14 +1036,14 @@ Polarization: {antenna.polarization}
             self.elec_tilt_var.get()
         )
         result = f"Total Tilt: {total:.2f}°"
-        messagebox.showinfo("Total Tilt", result)
+        self._show_info("Total Tilt", result)
         self.add_to_results("Tilt Calculation", result)
 
     def calculate_free_space_loss(self):
         """Calculate free space path loss"""
         loss = self.rf_calc.free_space_path_loss(1.0, 900.0)
         result = f"Free Space Path Loss (1km @ 900MHz): {loss:.2f} dB"
-        messagebox.showinfo("Free Space Loss", result)
+        self._show_info("Free Space Loss", result)
         self.add_to_results("Free Space Loss", result)
 
     def calculate_beamwidth(self):
@@ -992,28 +1054,24 @@ Polarization: {antenna.polarization}
                       f"Horizontal Beamwidth: {antenna.horizontal_bw}°\n"
                       f"Vertical Beamwidth: {antenna.vertical_bw}°\n"
                       f"Gain: {antenna.gain} dBi")
-            messagebox.showinfo("Beamwidth Calculator", result)
+            self._show_info("Beamwidth Calculator", result)
             self.add_to_results("Beamwidth Calculator", result)
 
     def search_antennas(self):
         """Search antennas based on criteria"""
-        try:
-            frequency = self.search_freq_var.get()
-            results = self.antenna_db.search_antennas(frequency=frequency)
+        frequency = self.search_freq_var.get()
+        results = self.antenna_db.search_antennas(frequency=frequency)
 
-            if results:
-                result_text = f"Found {len(results)} antennas at {frequency} MHz:\n\n"
-                for ant in results:
-                    result_text += f"- {ant.name} ({ant.manufacturer}): "
-                    result_text += f"{ant.gain} dBi, {ant.horizontal_bw}° HBW\n"
+        if results:
+            result_text = f"Found {len(results)} antennas at {frequency} MHz:\n\n"
+            for ant in results:
+                result_text += f"- {ant.name} ({ant.manufacturer}): "
+                result_text += f"{ant.gain} dBi, {ant.horizontal_bw}° HBW\n"
 
-                messagebox.showinfo("Antenna Search Results", result_text)
-                self.add_to_results("Antenna Search", result_text)
-            else:
-                messagebox.showinfo("Antenna Search", "No antennas found matching criteria")
-
-        except Exception as e:
-            messagebox.showerror("Error", f"Search failed: {str(e)}")
+            self._show_info("Antenna Search Results", result_text)
+            self.add_to_results("Antenna Search", result_text)
+        else:
+            self._show_info("Antenna Search", "No antennas found matching criteria")
 
     # ==============================================
     # FILE OPERATIONS
@@ -1028,21 +1086,8 @@ Polarization: {antenna.polarization}
             )
 
             if filename:
-                config = {
-                    'site_id': self.current_site.site_id,
-                    'latitude': self.current_site.latitude,
-                    'longitude': self.current_site.longitude,
-                    'antenna_height': self.current_site.antenna_height,
-                    'azimuth': self.current_site.azimuth,
-                    'mechanical_tilt': self.current_site.mechanical_tilt,
-                    'electrical_tilt': self.current_site.electrical_tilt,
-                    'antenna_type': self.current_site.antenna_type,
-                    'frequency': self.current_site.frequency,
-                    'power': self.current_site.power
-                }
-
                 with open(filename, 'w') as f:
-                    json.dump(config, f, indent=4)
+                    json.dump(asdict(self.current_site), f, indent=4)
 
                 messagebox.showinfo("Success", f"Configuration exported to {filename}")
                 self.add_to_results("Export", f"Exported configuration to {filename}")
@@ -1062,15 +1107,7 @@ Polarization: {antenna.polarization}
                     config = json.load(f)
 
                 # Update UI variables
-                self.site_id_var.set(config.get('site_id', 'SITE001'))
-                self.lat_var.set(config.get('latitude', 0.0))
-                self.lon_var.set(config.get('longitude', 0.0))
-                self.height_var.set(config.get('antenna_height', 30.0))
-                self.azimuth_var.set(config.get('azimuth', 0.0))
-                self.mech_tilt_var.set(config.get('mechanical_tilt', 0.0))
-                self.elec_tilt_var.set(config.get('electrical_tilt', 0.0))
-                self.freq_var.set(config.get('frequency', 900.0))
-                self.power_var.set(config.get('power', 43.0))
+                self._apply_config(config)
 
                 # Update antenna if specified
                 antenna_type = config.get('antenna_type', '')
@@ -1086,6 +1123,30 @@ Polarization: {antenna.polarization}
         except Exception as e:
             messagebox.showerror("Error", f"Import failed: {str(e)}")
 
+    def _apply_config(self, config):
+        """Set site UI variables from a config dict, skipping unchanged values"""
+        defaults = SiteConfiguration()
+        var_map = {
+            'site_id': self.site_id_var,
+            'latitude': self.lat_var,
+            'longitude': self.lon_var,
+            'antenna_height': self.height_var,
+            'azimuth': self.azimuth_var,
+            'mechanical_tilt': self.mech_tilt_var,
+            'electrical_tilt': self.elec_tilt_var,
+            'frequency': self.freq_var,
+            'power': self.power_var,
+        }
+
+        for key, var in var_map.items():
+            value = config.get(key, getattr(defaults, key))
+            try:
+                unchanged = var.get() == value
+            except tk.TclError:
+                unchanged = False
+            if not unchanged:
+                var.set(value)
+
     def save_pattern(self):
         """Save antenna pattern to file"""
         try:
@@ -1095,7 +1156,8 @@ Polarization: {antenna.polarization}
             )
 
             if filename:
-                self.fig_pattern.savefig(filename, dpi=300, bbox_inches='tight')
+                bbox = self._pattern_bbox if self._pattern_bbox is not None else 'tight'
+                self.fig_pattern.savefig(filename, dpi=300, bbox_inches=bbox)
                 messagebox.showinfo("Success", f"Pattern saved to {filename}")
                 self.add_to_results("Export", f"Saved antenna pattern to {filename}")
 
@@ -1104,10 +1166,7 @@ Polarization: {antenna.polarization}
 
     def add_to_results(self, title, content):
         """Add calculation results to results display"""
-        self.results_text.insert(tk.END, f"\n{'=' * 60}\n")
-        self.results_text.insert(tk.END, f"{title}\n")
-        self.results_text.insert(tk.END, f"{'=' * 60}\n")
-        self.results_text.insert(tk.END, f"{content}\n")
+        self.results_text.insert(tk.END, self._BANNER.format(title=title, content=content))
         self.results_text.see(tk.END)
 
 
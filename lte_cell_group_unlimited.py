@@ -1,24 +1,95 @@
 import sys
 import os
-import subprocess
 import re
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, 
                            QPushButton, QLabel, QLineEdit, QTextEdit, QWidget, 
                            QFileDialog, QMessageBox, QFrame)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
-from PyQt6.QtGui import QFont, QIcon, QPalette, QColor
-import pandas as pd
+from PyQt6.QtCore import Qt, QThread, pyqtSignal, QUrl, QTimer, QSignalBlocker
+from PyQt6.QtGui import QFont, QIcon, QPalette, QColor, QDesktopServices
 from openpyxl import load_workbook
+from openpyxl.styles.colors import COLOR_INDEX
 from openpyxl.utils import get_column_letter
-from openpyxl.styles import Alignment
+import xlsxwriter
 import traceback
+from operator import itemgetter
+from functools import lru_cache
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Invalid characters for Windows filenames
+INVALID_FILENAME_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+# Delimiters accepted between LRDs: comma, semicolon, space, newline, tab
+LRD_SPLIT_RE = re.compile(r'[,;\s\n\t]+')
+
+# PRS Object Tree header candidates (lowercase) for each column we read
+PRS_COLUMN_CANDIDATES = {
+    'cell_name': ('cell name', 'cellname'),
+    'cell_id': ('cell id', 'cellid', 'cid'),
+    'enodeb_id': ('enodeb id', 'enodebid'),
+    'enodeb_name': ('enodeb name', 'enodebname', 'e nodeb name', 'enodeb'),
+}
+
+# openpyxl style names -> XlsxWriter format values, for copying template cell styles
+BORDER_STYLES = {
+    'thin': 1, 'medium': 2, 'dashed': 3, 'dotted': 4, 'thick': 5, 'double': 6, 'hair': 7,
+    'mediumDashed': 8, 'dashDot': 9, 'mediumDashDot': 10, 'dashDotDot': 11,
+    'mediumDashDotDot': 12, 'slantDashDot': 13,
+}
+FILL_PATTERNS = {
+    'solid': 1, 'mediumGray': 2, 'darkGray': 3, 'lightGray': 4, 'darkHorizontal': 5,
+    'darkVertical': 6, 'darkDown': 7, 'darkUp': 8, 'darkGrid': 9, 'darkTrellis': 10,
+    'lightHorizontal': 11, 'lightVertical': 12, 'lightDown': 13, 'lightUp': 14,
+    'lightGrid': 15, 'lightTrellis': 16, 'gray125': 17, 'gray0625': 18,
+}
+HORIZONTAL_ALIGN = {
+    'left': 'left', 'center': 'center', 'right': 'right', 'fill': 'fill', 'justify': 'justify',
+    'centerContinuous': 'center_across', 'distributed': 'distributed',
+}
+VERTICAL_ALIGN = {
+    'top': 'top', 'center': 'vcenter', 'bottom': 'bottom', 'justify': 'vjustify',
+    'distributed': 'vdistributed',
+}
+UNDERLINE_STYLES = {'single': 1, 'double': 2, 'singleAccounting': 33, 'doubleAccounting': 34}
+
+# One template sheet: rows of (value, format properties); the output sheet keeps only the header row
+TemplateSheet = namedtuple('TemplateSheet', 'title active rows row_heights col_widths')
+
+
+def find_columns(header_row, targets):
+    """Map each target to a header column index (case-insensitive).
+
+    An exact header match wins; otherwise the earliest candidate contained in a header is used,
+    resolved in a single pass over the headers. Unmatched targets map to None.
+    """
+    cols_map = {}
+    for idx, name in enumerate(header_row):
+        if name is not None:
+            cols_map.setdefault(str(name).strip().lower(), idx)
+
+    found = {}
+    pending = {}
+    for target, candidates in targets.items():
+        found[target] = next((cols_map[c] for c in candidates if c in cols_map), None)
+        if found[target] is None:
+            pending[target] = candidates
+
+    # fallback: contains match
+    best_rank = {}
+    for header, idx in cols_map.items():
+        for target, candidates in pending.items():
+            for rank, cand in enumerate(candidates):
+                if cand in header:
+                    if rank < best_rank.get(target, len(candidates)):
+                        best_rank[target] = rank
+                        found[target] = idx
+                    break
+    return found
 
 
 def sanitize_filename(filename):
     """Sanitize filename by removing invalid characters"""
-    # Remove invalid characters for Windows filenames
-    invalid_chars = r'[<>:"/\\|?*]'
-    sanitized = re.sub(invalid_chars, '_', filename)
+    sanitized = INVALID_FILENAME_CHARS_RE.sub('_', filename)
     # Remove leading/trailing spaces and dots
     sanitized = sanitized.strip('. ')
     # Limit length to avoid filesystem issues
@@ -27,6 +98,116 @@ def sanitize_filename(filename):
     return sanitized if sanitized else "Cell_Group"
 
 
+def template_color(color):
+    """'#RRGGBB' for an RGB or indexed openpyxl colour; None for theme or unset colours"""
+    if color is None:
+        return None
+    if color.type == 'rgb' and isinstance(color.rgb, str):
+        return '#' + color.rgb[-6:]
+    if color.type == 'indexed' and isinstance(color.indexed, int) and color.indexed < len(COLOR_INDEX):
+        return '#' + COLOR_INDEX[color.indexed][-6:]
+    return None
+
+
+def template_cell_format(cell):
+    """XlsxWriter format properties for an openpyxl cell's font, fill, border, alignment and number format"""
+    props = {}
+
+    font = cell.font
+    if font is not None:
+        if font.name:
+            props['font_name'] = font.name
+        if font.sz:
+            props['font_size'] = float(font.sz)
+        if font.b:
+            props['bold'] = True
+        if font.i:
+            props['italic'] = True
+        if font.strike:
+            props['font_strikeout'] = True
+        if font.u in UNDERLINE_STYLES:
+            props['underline'] = UNDERLINE_STYLES[font.u]
+        font_color = template_color(font.color)
+        if font_color:
+            props['font_color'] = font_color
+
+    fill = cell.fill
+    if fill is not None and fill.fill_type in FILL_PATTERNS:
+        fg_color = template_color(fill.fgColor)
+        if fill.fill_type == 'solid':
+            # XlsxWriter takes a solid fill's colour as bg_color
+            if fg_color:
+                props['bg_color'] = fg_color
+        else:
+            props['pattern'] = FILL_PATTERNS[fill.fill_type]
+            bg_color = template_color(fill.bgColor)
+            if fg_color:
+                props['fg_color'] = fg_color
+            if bg_color:
+                props['bg_color'] = bg_color
+
+    border = cell.border
+    if border is not None:
+        for side_name in ('left', 'right', 'top', 'bottom'):
+            side = getattr(border, side_name)
+            if side is not None and side.style in BORDER_STYLES:
+                props[side_name] = BORDER_STYLES[side.style]
+                side_color = template_color(side.color)
+                if side_color:
+                    props[f'{side_name}_color'] = side_color
+
+    alignment = cell.alignment
+    if alignment is not None:
+        if alignment.horizontal in HORIZONTAL_ALIGN:
+            props['align'] = HORIZONTAL_ALIGN[alignment.horizontal]
+        if alignment.vertical in VERTICAL_ALIGN:
+            props['valign'] = VERTICAL_ALIGN[alignment.vertical]
+        if alignment.wrap_text:
+            props['text_wrap'] = True
+        if alignment.shrink_to_fit:
+            props['shrink'] = True
+        if alignment.indent:
+            props['indent'] = int(alignment.indent)
+        if alignment.text_rotation:
+            props['rotation'] = int(alignment.text_rotation)
+
+    if cell.number_format and cell.number_format != 'General':
+        props['num_format'] = cell.number_format
+
+    return props
+
+
+@lru_cache(maxsize=4)
+def read_template(template_path, mtime):
+    """Read the template's sheets, with cell styles, row heights and column widths.
+
+    The active sheet keeps only its header row (data rows are replaced by the output);
+    other sheets are kept whole. Cached per (path, mtime) so repeated runs reuse the
+    template until it changes.
+    """
+    wb = load_workbook(template_path)
+    try:
+        sheets = []
+        for ws in wb.worksheets:
+            active = ws is wb.active
+            rows = []
+            for row_cells in ws.iter_rows(max_row=1 if active else ws.max_row):
+                rows.append(tuple((cell.value, template_cell_format(cell)) for cell in row_cells))
+            row_heights = {
+                idx - 1: dim.height for idx, dim in ws.row_dimensions.items()
+                if dim.height is not None and (not active or idx == 1)
+            }
+            col_widths = {}
+            for col in range(1, ws.max_column + 1):
+                dim = ws.column_dimensions.get(get_column_letter(col))
+                if dim is not None and dim.width:
+                    col_widths[col - 1] = dim.width
+            sheets.append(TemplateSheet(ws.title, active, tuple(rows), row_heights, col_widths))
+        return tuple(sheets)
+    finally:
+        wb.close()
+
+
 class ProcessingThread(QThread):
     """Thread for processing Excel data to avoid GUI freezing"""
     finished = pyqtSignal(bool, str, str)  # Added third parameter for output file path
@@ -54,144 +235,97 @@ class ProcessingThread(QThread):
                 self.finished.emit(False, f"Template file not found: {template_source}", "")
                 return
 
-            # Load the PRS Object Tree workbook (header at row 3 -> header=2)
+            # Stream the PRS Object Tree read-only; header is row 3 and only matching rows are kept
             # We expect the column header 'Cell Name' to be at column H (header row is row 3)
-            prs_df = pd.read_excel(self.genexep_file, header=2, dtype=str)
-
-            # Find important columns (case-insensitive). We require 'Cell Name'.
-            cols_map = {c.strip().lower(): c for c in prs_df.columns}
-
-            def find_col(candidates):
-                for cand in candidates:
-                    key = cand.strip().lower()
-                    if key in cols_map:
-                        return cols_map[key]
-                # fallback: contains match
-                for cand in candidates:
-                    key = cand.strip().lower()
-                    for k, orig in cols_map.items():
-                        if key in k:
-                            return orig
-                return None
-
-            cell_name_col = find_col(['cell name', 'cellname'])
-            if not cell_name_col:
-                self.finished.emit(False, "Could not find 'Cell Name' column in PRS Object Tree (expected header at row 3, column H).", "")
-                return
-
-            cell_id_col = find_col(['cell id', 'cellid', 'cid'])
-            enodeb_id_col = find_col(['enodeb id', 'enodebid', 'enodeb id'])
-            enodeb_name_col = find_col(['enodeb name', 'enodebname', 'e nodeb name', 'enodeb'])
-
-            # Create 4LRD from first 4 characters of Cell Name (uppercase)
-            prs_df['4LRD'] = prs_df[cell_name_col].astype(str).str.upper().str[:4]
-
-            # Filter rows where 4LRD matches any of the provided LRDs
-            lrd_set = set([l.upper() for l in self.lrd_list])
-            filtered_data = prs_df[prs_df['4LRD'].isin(lrd_set)].copy()
-
-            if filtered_data.empty:
+            prs_wb = load_workbook(self.genexep_file, read_only=True, data_only=True)
+            try:
+                prs_ws = prs_wb.worksheets[0]
+                header_row = next(prs_ws.iter_rows(min_row=3, max_row=3, values_only=True), ())
+
+                # Find important columns (case-insensitive). We require 'Cell Name'.
+                columns = find_columns(header_row, PRS_COLUMN_CANDIDATES)
+                cell_name_idx = columns['cell_name']
+                if cell_name_idx is None:
+                    self.finished.emit(False, "Could not find 'Cell Name' column in PRS Object Tree (expected header at row 3, column H).", "")
+                    return
+
+                cell_id_idx = columns['cell_id']
+                enodeb_id_idx = columns['enodeb_id']
+                enodeb_name_idx = columns['enodeb_name']
+
+                # Rows are padded to the header width plus one trailing None, which stands in
+                # for any optional column that is missing from the sheet
+                width = len(header_row)
+                pick = itemgetter(*[width if idx is None else idx
+                                    for idx in (cell_id_idx, cell_name_idx, enodeb_id_idx, enodeb_name_idx)])
+
+                # Keep rows whose 4LRD (first 4 characters of Cell Name, uppercase) was provided.
+                # Each kept row is a (cell_id, cell_name, enodeb_id, enodeb_name) tuple of strings.
+                lrd_set = set([l.upper() for l in self.lrd_list])
+                rows = []
+                for row in prs_ws.iter_rows(min_row=4, max_col=width, values_only=True):
+                    cell_name = row[cell_name_idx]
+                    # Slice before upper() so only the 4-character prefix is case-folded
+                    if cell_name is None or str(cell_name)[:4].upper() not in lrd_set:
+                        continue
+                    item = tuple('' if v is None else str(v) for v in pick(row + (None,)))
+                    # Verification check: Drop rows where 5th character of eNodeB Name is "B"
+                    if item[3][4:5] == "B":
+                        continue
+                    rows.append(item)
+            finally:
+                prs_wb.close()
+
+            if not rows:
                 self.finished.emit(False, "No matching data found for the provided 4LRDs in PRS Object Tree.", "")
                 return
 
-            # Prepare rows list with the columns we will write to the template
-            rows = []
-            for _, r in filtered_data.iterrows():
-                rows.append({
-                    'cell_id': r.get(cell_id_col, '') if cell_id_col else '',
-                    'cell_name': r.get(cell_name_col, ''),
-                    'enodeb_id': r.get(enodeb_id_col, '') if enodeb_id_col else '',
-                    'enodeb_name': r.get(enodeb_name_col, '') if enodeb_name_col else ''
-                })
-
             # Split rows into chunks respecting eNodeB Name groups and max rows limit
             MAX_ROWS = 10000
             chunks = []
             current = []
+            group_start = 0  # index in current where the latest eNodeB Name group begins
+            prev_name = None
             for r in rows:
+                if r[3] != prev_name:
+                    group_start = len(current)
+                    prev_name = r[3]
                 current.append(r)
                 if len(current) > MAX_ROWS:
-                    # Determine the last group's name in current chunk
-                    last_group = current[-1].get('enodeb_name', '')
-                    # Find the first index of this last_group in current
-                    split_idx = None
-                    for idx, item in enumerate(current):
-                        if item.get('enodeb_name', '') == last_group:
-                            split_idx = idx
-                            break
-
-                    if split_idx is None or split_idx == 0:
-                        # The group itself is larger than MAX_ROWS or no earlier boundary: finalize whole current
+                    if group_start == 0:
+                        # The group itself is larger than MAX_ROWS: finalize whole current
                         chunks.append(current)
                         current = []
                     else:
-                        # Finalize up to split_idx (exclude the group that caused overflow)
-                        chunks.append(current[:split_idx])
+                        # Finalize up to the group start (exclude the group that caused overflow)
+                        chunks.append(current[:group_start])
                         # Start new current with the overflowing group
-                        current = current[split_idx:]
+                        current = current[group_start:]
+                    group_start = 0
 
             if current:
                 chunks.append(current)
 
+            # Template is read once; each chunk is streamed below its header with XlsxWriter
+            template = read_template(template_source, os.path.getmtime(template_source))
+
             # Write each chunk into its own workbook (use part suffix if more than one)
             output_paths = []
-            total_written = 0
-            part = 1
-            for chunk in chunks:
-                wb = load_workbook(template_source)
-                ws = wb.active
-
-                # Clear existing data
-                for row_cells in ws.iter_rows(min_row=2, max_row=ws.max_row):
-                    for cell in row_cells:
-                        cell.value = None
-
-                center_alignment = Alignment(horizontal='center', vertical='center')
-                row_num = 2
-                for item in chunk:
-                    ws.cell(row=row_num, column=1, value=self.cell_group_name).alignment = center_alignment
-                    ws.cell(row=row_num, column=2, value=item.get('cell_id', '')).alignment = center_alignment
-                    ws.cell(row=row_num, column=3, value=item.get('cell_name', '')).alignment = center_alignment
-                    ws.cell(row=row_num, column=4, value=item.get('enodeb_id', '')).alignment = center_alignment
-                    ws.cell(row=row_num, column=5, value=item.get('enodeb_name', '')).alignment = center_alignment
-                    ws.cell(row=row_num, column=6, value='admin').alignment = center_alignment
-                    row_num += 1
-
-                # Verification check: Remove rows where 5th character of eNodeB Name is "B"
-                rows_to_delete = []
-                for r_idx in range(2, ws.max_row + 1):
-                    enodeb_name_cell = ws.cell(row=r_idx, column=5)
-                    enodeb_name = str(enodeb_name_cell.value) if enodeb_name_cell.value else ""
-                    if len(enodeb_name) >= 5 and enodeb_name[4] == "B":
-                        rows_to_delete.append(r_idx)
-                for r_idx in reversed(rows_to_delete):
-                    ws.delete_rows(r_idx)
-
-                # Auto-fit columns
-                for column in ws.columns:
-                    max_length = 0
-                    column_letter = get_column_letter(column[0].column)
-                    for cell in column:
-                        try:
-                            if cell.value is not None and len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    adjusted_width = min(max_length + 2, 50)
-                    ws.column_dimensions[column_letter].width = adjusted_width
-
-                # Save file
+            for part in range(1, len(chunks) + 1):
                 if len(chunks) == 1:
                     out_name = output_filename
                 else:
                     out_name = f"{sanitized_name}_Cell_Group_part{part}.xlsx"
-                out_path = os.path.join(self.template_dir, out_name)
-                wb.save(out_path)
-                wb.close()
+                output_paths.append(os.path.join(self.template_dir, out_name))
 
-                output_paths.append(out_path)
-                total_written += (ws.max_row - 1 if ws.max_row > 1 else 0)
-                part += 1
+            # Parts are independent files, so they are written concurrently
+            max_workers = min(len(chunks), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                written_counts = list(executor.map(
+                    lambda args: self._write_chunk(*args, template),
+                    zip(chunks, output_paths)
+                ))
+            total_written = sum(written_counts)
 
             # Compose success message
             if len(output_paths) == 1:
@@ -208,6 +342,66 @@ class ProcessingThread(QThread):
             error_msg = f"Error processing data: {str(e)}\n{traceback.format_exc()}"
             self.finished.emit(False, error_msg, "")
 
+    def _write_chunk(self, chunk, out_path, template):
+        """Write one chunk of rows below the template header and return the number of rows written"""
+        wb = xlsxwriter.Workbook(out_path, {'constant_memory': True, 'strings_to_numbers': False})
+        center_fmt = wb.add_format({'align': 'center', 'valign': 'vcenter'})
+
+        # One Format per distinct template style
+        formats = {}
+
+        def template_format(props):
+            if not props:
+                return None
+            key = tuple(sorted(props.items()))
+            if key not in formats:
+                formats[key] = wb.add_format(props)
+            return formats[key]
+
+        ws = None
+        header = ()
+        for sheet in template:
+            sheet_ws = wb.add_worksheet(sheet.title)
+            # Rows go out in order (constant_memory), each after its height is set
+            for row_idx, row in enumerate(sheet.rows):
+                if row_idx in sheet.row_heights:
+                    sheet_ws.set_row(row_idx, sheet.row_heights[row_idx])
+                for col, (value, props) in enumerate(row):
+                    cell_fmt = template_format(props)
+                    if value is not None:
+                        sheet_ws.write(row_idx, col, value, cell_fmt)
+                    elif cell_fmt is not None:
+                        sheet_ws.write_blank(row_idx, col, None, cell_fmt)
+            if sheet.active:
+                ws = sheet_ws
+                header = sheet.rows[0] if sheet.rows else ()
+                sheet_ws.activate()
+            else:
+                for col, width in sheet.col_widths.items():
+                    sheet_ws.set_column(col, col, width)
+
+        # Column widths start from the header and track the longest value as rows are written
+        col_widths = [len(str(value)) if value is not None else 0 for value, _ in header]
+        col_widths += [0] * (6 - len(col_widths))
+        col_widths[0] = max(col_widths[0], len(self.cell_group_name))
+        col_widths[5] = max(col_widths[5], len('admin'))
+
+        row_num = 1
+        for item in chunk:
+            ws.write_row(row_num, 0, (self.cell_group_name,) + item + ('admin',), center_fmt)
+            for idx, value in enumerate(item, 1):
+                if len(value) > col_widths[idx]:
+                    col_widths[idx] = len(value)
+            row_num += 1
+
+        # Auto-fit columns
+        for idx, width in enumerate(col_widths):
+            ws.set_column(idx, idx, min(width + 2, 50))
+
+        # Save file
+        wb.close()
+        return len(chunk)
+
 
 class GenexEPApp(QMainWindow):
     def __init__(self):
@@ -329,7 +523,13 @@ class GenexEPApp(QMainWindow):
         # Make the input field taller so roughly 4 rows are visible
         self.lrd_input.setFixedHeight(140)
         self.lrd_input.setPlaceholderText("Paste Site Name or eNodeB Name here...")
-        self.lrd_input.textChanged.connect(self.format_lrd_input)
+        # Debounce formatting so a burst of edits (e.g. a large paste) is formatted once
+        self._lrd_format_timer = QTimer(self)
+        self._lrd_format_timer.setSingleShot(True)
+        self._lrd_format_timer.setInterval(150)
+        self._lrd_format_timer.timeout.connect(self.format_lrd_input)
+        self._last_formatted_lrd = ""
+        self.lrd_input.textChanged.connect(self._lrd_format_timer.start)
         lrd_layout.addWidget(self.lrd_input)
         
         # 4LRD Counter label - positioned right below the input field
@@ -395,7 +595,7 @@ class GenexEPApp(QMainWindow):
             self,
             "Select PRS Object Tree Excel File",
             "",
-            "Excel Files (*.xlsx *.xls)"
+            "Excel Files (*.xlsx *.xlsm)"
         )
         
         if file_path:
@@ -434,18 +634,22 @@ class GenexEPApp(QMainWindow):
         # Get current text
         current_text = self.lrd_input.toPlainText()
         
+        # Nothing to do if the text is exactly what we produced last time
+        if current_text == self._last_formatted_lrd:
+            self.check_generate_button()
+            return
+        
         # Don't format if text is empty or only whitespace
         if not current_text.strip():
-            # Update counter for empty input
+            # Update counter for empty input; the next non-empty text must be formatted again
             self.lrd_counter_label.setText("0 4LRDs entered")
+            self._last_formatted_lrd = ""
             # Always check generate button state
             self.check_generate_button()
             return
         
-        # Split by various delimiters and clean up
-        import re
-        # Split by comma, semicolon, space, newline, tab
-        items = re.split(r'[,;\s\n\t]+', current_text)
+        # Split by comma, semicolon, space, newline, tab and clean up
+        items = LRD_SPLIT_RE.split(current_text)
         
         # Clean up items: remove empty strings, strip whitespace, convert to uppercase
         cleaned_items = []
@@ -475,8 +679,8 @@ class GenexEPApp(QMainWindow):
         
         # Only update if the text actually changed to avoid infinite recursion
         if formatted_text != current_text:
-            # Temporarily disconnect the signal to avoid recursion
-            self.lrd_input.textChanged.disconnect()
+            # Block textChanged while we replace the text ourselves
+            blocker = QSignalBlocker(self.lrd_input)
             
             # Update the text
             self.lrd_input.setPlainText(formatted_text)
@@ -486,8 +690,8 @@ class GenexEPApp(QMainWindow):
             cursor.setPosition(new_position)
             self.lrd_input.setTextCursor(cursor)
             
-            # Reconnect the signal
-            self.lrd_input.textChanged.connect(self.format_lrd_input)
+            blocker.unblock()
+        self._last_formatted_lrd = formatted_text
         
         # Always check if generate button should be enabled after any input change
         self.check_generate_button()
@@ -573,6 +777,11 @@ class GenexEPApp(QMainWindow):
             )
             return
         
+        # Apply any pending debounced formatting before reading the 4LRD input
+        if self._lrd_format_timer.isActive():
+            self._lrd_format_timer.stop()
+            self.format_lrd_input()
+        
         # Parse 4LRD input
         lrd_text = self.lrd_input.toPlainText().strip()
         lrd_list = [lrd.strip().upper() for lrd in lrd_text.split(',') if lrd.strip()]
@@ -615,19 +824,12 @@ class GenexEPApp(QMainWindow):
                 message
             )
             
-            # Open the updated template file
-            try:
-                if sys.platform.startswith('win'):
-                    os.startfile(self.output_file_path)
-                elif sys.platform.startswith('darwin'):  # macOS
-                    subprocess.run(['open', self.output_file_path])
-                else:  # Linux
-                    subprocess.run(['xdg-open', self.output_file_path])
-            except Exception as e:
+            # Open the updated template file (hands off to the OS without waiting for the launcher)
+            if not QDesktopServices.openUrl(QUrl.fromLocalFile(self.output_file_path)):
                 self.show_sharp_message_box(
                     QMessageBox.Icon.Warning, 
                     "Fadzli Abdullah", 
-                    f"File processed successfully but couldn't open automatically: {str(e)}"
+                    "File processed successfully but couldn't open automatically."
                 )
         else:
             self.show_sharp_message_box(
@@ -1,31 +1,243 @@
 import sys
 import os
+import gc
+import ctypes
+import heapq
+import threading
 import zipfile
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from xml.etree import ElementTree as ET
+
+try:
+    from lxml import etree as ET
+except ImportError:
+    from xml.etree import ElementTree as ET
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Stand-in when numba is not installed: leave the function as plain Python"""
+        return lambda func: func
 
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                               QHBoxLayout, QPushButton, QLabel, QFileDialog, 
                               QTextEdit, QGroupBox, QSpinBox, QDoubleSpinBox,
-                              QCheckBox, QMessageBox, QSplitter, QLineEdit)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
-from PyQt6.QtGui import QFont
+                              QCheckBox, QMessageBox, QSplitter, QLineEdit,
+                              QComboBox)
+from PyQt6.QtCore import Qt, QThread, QElapsedTimer, pyqtSignal
+from PyQt6.QtGui import QFont, QFontDatabase
 
+import numpy as np
 import geopandas as gpd
+import shapely
+from pyproj import Transformer
 from shapely.geometry import Polygon, MultiPolygon, Point
-from shapely.ops import unary_union
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
 
+# Upper bound and bisection steps when searching a tolerance that meets the point budget
+MAX_SIMPLIFY_TOLERANCE = 0.1
+SIMPLIFY_BISECT_STEPS = 10
+
+# Douglas-Peucker inputs at least this large are split across threads
+DP_PARALLEL_MIN_FEATURES = 256
+
+# Visvalingam-Whyatt runs per geometry, so larger inputs are spread over the thread pool
+VW_PARALLEL_MIN_FEATURES = 64
+
+# Progress lines are emitted at most this often, or once this many have queued up
+PROGRESS_INTERVAL_MS = 100
+PROGRESS_MAX_PENDING = 64
+
+
+def count_total_points(geoms):
+    """Total coordinate count of a geometry or geometry array (all rings and parts)
+    
+    Counted in GEOS without materializing any coordinate sequences.
+    """
+    return int(np.sum(shapely.get_num_coordinates(geoms)))
+
+
+@lru_cache(maxsize=128)
+def get_utm_transformers(utm_crs):
+    """Return cached (WGS84 -> UTM, UTM -> WGS84) transformers for a UTM CRS"""
+    return (Transformer.from_crs("EPSG:4326", utm_crs, always_xy=True),
+            Transformer.from_crs(utm_crs, "EPSG:4326", always_xy=True))
+
+
+def transform_geometry(geom, transformer):
+    """Reproject a geometry (or geometry array) with one vectorized pyproj call"""
+    return shapely.transform(
+        geom, lambda xy: np.column_stack(transformer.transform(xy[:, 0], xy[:, 1]))
+    )
+
+
+@njit(cache=True, nogil=True)
+def _triangle_area(coords, a, b, c):
+    return 0.5 * abs((coords[b, 0] - coords[a, 0]) * (coords[c, 1] - coords[a, 1])
+                     - (coords[c, 0] - coords[a, 0]) * (coords[b, 1] - coords[a, 1]))
+
+
+@njit(cache=True, nogil=True)
+def _vw_keep_mask(coords, min_area, min_keep):
+    n = coords.shape[0]
+    keep = np.ones(n, dtype=np.bool_)
+    if n <= min_keep:
+        return keep
+    
+    prev = np.arange(-1, n - 1)
+    nxt = np.arange(1, n + 1)
+    
+    # Initial effective areas of all interior vertices in one pass
+    x, y = coords[:, 0], coords[:, 1]
+    areas = np.full(n, np.inf)
+    areas[1:-1] = 0.5 * np.abs((x[1:-1] - x[:-2]) * (y[2:] - y[:-2])
+                               - (x[2:] - x[:-2]) * (y[1:-1] - y[:-2]))
+    heap = [(areas[i], i) for i in range(1, n - 1)]
+    heapq.heapify(heap)
+    
+    remaining = n
+    while len(heap) > 0 and remaining > min_keep:
+        area, i = heapq.heappop(heap)
+        if not keep[i] or area != areas[i]:
+            continue  # Stale entry
+        if area >= min_area:
+            break
+        
+        keep[i] = False
+        remaining -= 1
+        p, q = prev[i], nxt[i]
+        nxt[p], prev[q] = q, p
+        
+        # Neighbours never get a smaller effective area than the point just removed
+        for j in (p, q):
+            if 0 < j < n - 1:
+                areas[j] = max(_triangle_area(coords, prev[j], j, nxt[j]), area)
+                heapq.heappush(heap, (areas[j], j))
+    
+    return keep
+
+
+def visvalingam_whyatt(coords, min_area, min_keep):
+    """Visvalingam-Whyatt vertex elimination on an (N, 2) coordinate array
+    
+    Repeatedly drops the vertex forming the smallest triangle with its
+    neighbours until every remaining triangle is at least min_area or only
+    min_keep vertices are left. Endpoints are always kept. Returns the
+    retained coordinates. The elimination loop is compiled with numba when
+    it is installed.
+    """
+    coords = np.ascontiguousarray(coords, dtype=np.float64)
+    return coords[_vw_keep_mask(coords, float(min_area), min_keep)]
+
+
+def simplify_vw(geom, tolerance):
+    """Simplify a (Multi)Polygon with Visvalingam-Whyatt
+    
+    The area threshold is tolerance squared, so the same tolerance setting is
+    comparable to Douglas-Peucker. Falls back to the topology-preserving
+    Douglas-Peucker result for other types or when VW yields an invalid shape.
+    """
+    min_area = tolerance ** 2
+    
+    if isinstance(geom, Polygon):
+        shell = visvalingam_whyatt(shapely.get_coordinates(geom.exterior), min_area, 4)
+        holes = [visvalingam_whyatt(shapely.get_coordinates(ring), min_area, 4)
+                 for ring in geom.interiors]
+        result = Polygon(shell, holes)
+    elif isinstance(geom, MultiPolygon):
+        result = MultiPolygon([simplify_vw(part, tolerance) for part in geom.geoms])
+    else:
+        result = None
+    
+    if result is None or not result.is_valid:
+        return shapely.simplify(geom, tolerance, preserve_topology=True)
+    return result
+
+
+@lru_cache(maxsize=1)
+def get_thread_pool():
+    """Shared thread pool for GEOS array calls, which release the GIL"""
+    return ThreadPoolExecutor(max_workers=os.cpu_count())
+
+
+def simplify_array(geoms, tolerance, algorithm='dp'):
+    """Simplify a geometry array with 'dp' (Douglas-Peucker) or 'vw' (Visvalingam-Whyatt)
+    
+    tolerance may be a scalar or an array with one value per geometry.
+    """
+    tolerances = np.broadcast_to(tolerance, geoms.shape)
+    
+    if algorithm != 'vw':
+        if len(geoms) < DP_PARALLEL_MIN_FEATURES:
+            return shapely.simplify(geoms, tolerances, preserve_topology=True)
+        # One slice per core; GEOS runs each slice without holding the GIL
+        n_chunks = os.cpu_count() or 1
+        parts = get_thread_pool().map(
+            lambda chunk, tols: shapely.simplify(chunk, tols, preserve_topology=True),
+            np.array_split(geoms, n_chunks), np.array_split(tolerances, n_chunks)
+        )
+        return np.concatenate(list(parts))
+    
+    simplified = np.empty(len(geoms), dtype=object)
+    if len(geoms) >= VW_PARALLEL_MIN_FEATURES:
+        # The numba kernels release the GIL, so threads overlap the per-ring work
+        simplified[:] = list(get_thread_pool().map(simplify_vw, geoms, tolerances))
+    else:
+        simplified[:] = [simplify_vw(geom, tol) for geom, tol in zip(geoms, tolerances)]
+    return simplified
+
+
+def stack_coords(coord_arrays):
+    """Concatenate per-feature coordinate arrays for shapely's bulk constructors
+    
+    Returns (coords, indices) where indices gives the feature of each row.
+    """
+    counts = [len(coords) for coords in coord_arrays]
+    return np.concatenate(coord_arrays), np.repeat(np.arange(len(counts)), counts)
+
+
+def release_memory():
+    """Collect garbage and, on glibc, hand freed heap pages back to the OS"""
+    gc.collect()
+    if sys.platform.startswith('linux'):
+        try:
+            ctypes.CDLL("libc.so.6").malloc_trim(0)
+        except (OSError, AttributeError):
+            pass
+
+
+def iter_kml_placemarks(kml_source):
+    """Stream Placemark elements from a KML path or file object.
+
+    Namespaces are stripped from each placemark's subtree so callers can use
+    plain tag paths. Each placemark is cleared once the caller moves on to the
+    next one, so the full document tree is never held in memory.
+    """
+    for _, elem in ET.iterparse(kml_source, events=('end',)):
+        if isinstance(elem.tag, str) and elem.tag.rpartition('}')[2] == 'Placemark':
+            for child in elem.iter():
+                if isinstance(child.tag, str):
+                    child.tag = child.tag.rpartition('}')[2]
+            yield elem
+            elem.clear()
+            # lxml keeps cleared elements attached; drop processed siblings as well
+            if hasattr(elem, 'getprevious'):
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+
+
 class ConversionThread(QThread):
     """Thread for handling file conversion operations"""
     finished = pyqtSignal(bool, str)
     progress = pyqtSignal(str)
     
-    def __init__(self, input_file, output_dir, formats, simplify, tolerance, max_points, buffer_width=40, output_name=None):
+    def __init__(self, input_file, output_dir, formats, simplify, tolerance, max_points, buffer_width=40, output_name=None,
+                 algorithm='dp'):
         super().__init__()
         self.input_file = input_file
         self.output_dir = output_dir
@@ -35,33 +247,52 @@ class ConversionThread(QThread):
         self.max_points = max_points
         self.buffer_width = buffer_width  # Now in meters
         self.output_name = output_name
+        self.algorithm = algorithm  # 'dp' (Douglas-Peucker) or 'vw' (Visvalingam-Whyatt)
+        self._pending_progress = []
+        self._progress_timer = QElapsedTimer()
+    
+    def report(self, message):
+        """Queue a progress line; queued lines go out as one signal, at most every PROGRESS_INTERVAL_MS"""
+        self._pending_progress.append(message)
+        if (len(self._pending_progress) >= PROGRESS_MAX_PENDING or not self._progress_timer.isValid()
+                or self._progress_timer.elapsed() >= PROGRESS_INTERVAL_MS):
+            self.flush_progress()
+    
+    def flush_progress(self):
+        """Emit all queued progress lines as one multi-line message"""
+        if self._pending_progress:
+            self.progress.emit("\n".join(self._pending_progress))
+            self._pending_progress.clear()
+        self._progress_timer.start()
+    
+    def finish(self, success, message):
+        """Flush queued progress, then report the result"""
+        self.flush_progress()
+        self.finished.emit(success, message)
         
     def run(self):
         try:
             # Load KMZ/KML
-            self.progress.emit("Reading KMZ/KML file...")
+            self.report("Reading KMZ/KML file...")
             gdf = self.load_kmz_kml(self.input_file, self.buffer_width)
             
             if gdf is None or gdf.empty:
-                self.finished.emit(False, "No valid geometries found in file")
+                self.finish(False, "No valid geometries found in file")
                 return
             
             # Check point count and simplify if needed
-            original_points = sum([len(geom.exterior.coords) if isinstance(geom, Polygon) else 
-                                 sum([len(p.exterior.coords) for p in geom.geoms]) 
-                                 for geom in gdf.geometry])
+            original_points = count_total_points(gdf.geometry.values)
             
-            self.progress.emit(f"Original polygon has {original_points} points")
+            self.report(f"Original polygon has {original_points} points")
             
             if self.simplify or original_points > self.max_points:
-                self.progress.emit(f"Simplifying polygon (max points: {self.max_points})...")
+                self.report(f"Simplifying polygon (max points: {self.max_points})...")
+                self.flush_progress()  # Show it before the long step, not after
                 gdf = self.simplify_geometries(gdf, self.tolerance, self.max_points)
                 
-                new_points = sum([len(geom.exterior.coords) if isinstance(geom, Polygon) else 
-                                sum([len(p.exterior.coords) for p in geom.geoms]) 
-                                for geom in gdf.geometry])
+                new_points = count_total_points(gdf.geometry.values)
                 
-                self.progress.emit(f"Simplified to {new_points} points")
+                self.report(f"Simplified to {new_points} points")
             
             # Export to selected formats
             # Determine output base name
@@ -69,39 +300,53 @@ class ConversionThread(QThread):
                 base_name = self.output_name.strip()
                 # Remove any extensions if user added them
                 base_name = base_name.replace('.shp', '').replace('.geojson', '').replace('.tab', '')
-                self.progress.emit(f"Using custom filename: {base_name}")
+                self.report(f"Using custom filename: {base_name}")
             else:
                 base_name = Path(self.input_file).stem
-                self.progress.emit(f"Using original filename: {base_name}")
+                self.report(f"Using original filename: {base_name}")
             
             output_files = []
             
+            # (label, path, driver) for every selected format
+            exports = []
             if 'shapefile' in self.formats:
-                self.progress.emit("Converting to Shapefile...")
-                shp_path = os.path.join(self.output_dir, f"{base_name}.shp")
-                gdf.to_file(shp_path, driver='ESRI Shapefile')
-                output_files.append(shp_path)
-            
+                exports.append(("Shapefile", os.path.join(self.output_dir, f"{base_name}.shp"), 'ESRI Shapefile'))
             if 'geojson' in self.formats:
-                self.progress.emit("Converting to GeoJSON...")
-                geojson_path = os.path.join(self.output_dir, f"{base_name}.geojson")
-                gdf.to_file(geojson_path, driver='GeoJSON')
-                output_files.append(geojson_path)
-            
+                exports.append(("GeoJSON", os.path.join(self.output_dir, f"{base_name}.geojson"), 'GeoJSON'))
             if 'tab' in self.formats:
-                self.progress.emit("Converting to MapInfo TAB...")
-                tab_path = os.path.join(self.output_dir, f"{base_name}.tab")
-                try:
-                    gdf.to_file(tab_path, driver='MapInfo File')
-                    output_files.append(tab_path)
-                except Exception as e:
-                    self.progress.emit(f"Warning: TAB export failed - {str(e)}")
+                exports.append(("MapInfo TAB", os.path.join(self.output_dir, f"{base_name}.tab"), 'MapInfo File'))
+            
+            # GDAL releases the GIL while writing, so the formats are written concurrently
+            self.report(f"Converting to {', '.join(label for label, _, _ in exports)}...")
+            self.flush_progress()  # Show it before the long step, not after
+            with ThreadPoolExecutor(max_workers=max(len(exports), 1)) as executor:
+                futures = [(driver, path, executor.submit(self._write_output, gdf, path, driver))
+                           for _, path, driver in exports]
+                
+                for driver, path, future in futures:
+                    try:
+                        future.result()
+                        output_files.append(path)
+                    except Exception as e:
+                        if driver != 'MapInfo File':
+                            raise
+                        self.report(f"Warning: TAB export failed - {str(e)}")
             
             success_msg = f"Conversion successful!\n\nFiles created:\n" + "\n".join(output_files)
-            self.finished.emit(True, success_msg)
+            self.finish(True, success_msg)
             
         except Exception as e:
-            self.finished.emit(False, f"Conversion failed: {str(e)}")
+            self.finish(False, f"Conversion failed: {str(e)}")
+    
+    def _write_output(self, gdf, path, driver):
+        """Write gdf to path with the given OGR driver"""
+        try:
+            gdf.to_file(path, driver=driver, engine='pyogrio')
+        except Exception:
+            if driver != 'MapInfo File':
+                raise
+            # Some GDAL builds behind pyogrio lack the MapInfo driver
+            gdf.to_file(path, driver=driver, engine='fiona')
     
     def load_kmz_kml(self, file_path, buffer_width=40):
         """Load KMZ or KML file and convert to polygons
@@ -113,17 +358,15 @@ class ConversionThread(QThread):
         try:
             # Handle KMZ (zipped KML)
             if file_path.lower().endswith('.kmz'):
-                with tempfile.TemporaryDirectory() as temp_dir:
-                    with zipfile.ZipFile(file_path, 'r') as kmz:
-                        kmz.extractall(temp_dir)
-                        # Find KML file in extracted contents
-                        kml_files = list(Path(temp_dir).rglob('*.kml'))
-                        if not kml_files:
-                            raise Exception("No KML file found inside KMZ")
-                        kml_path = str(kml_files[0])
-                        
-                        # Parse KML inside the temp directory context
-                        return self._parse_kml_file(kml_path, buffer_width)
+                with zipfile.ZipFile(file_path, 'r') as kmz:
+                    # Find the KML entry; other entries (images, icons) are never read
+                    kml_name = next((n for n in kmz.namelist() if n.lower().endswith('.kml')), None)
+                    if kml_name is None:
+                        raise Exception("No KML file found inside KMZ")
+                    
+                    # Parse the KML straight from the archive stream
+                    with kmz.open(kml_name) as kml_file:
+                        return self._parse_kml_file(kml_file, buffer_width)
             else:
                 # Direct KML file
                 return self._parse_kml_file(file_path, buffer_width)
@@ -135,122 +378,79 @@ class ConversionThread(QThread):
         """Parse KML file and return GeoDataFrame
         
         Args:
-            kml_file_path: Path to KML file
+            kml_file_path: Path to KML file (or a readable file object)
             buffer_width: Buffer width in METERS for LineString conversion
         """
         try:
-            # Parse KML
-            tree = ET.parse(kml_file_path)
-            root = tree.getroot()
-            
-            # Handle KML namespace
-            ns = {'kml': 'http://www.opengis.net/kml/2.2'}
-            if not root.tag.startswith('{'):
-                ns = {}
-            
             geometries = []
             names = []
             geom_types = []
+            polygon_coords = []
+            polygon_slots = []
+            line_coords = []
+            line_slots = []
             
-            # Extract all geometry types
-            placemarks = root.findall('.//kml:Placemark', ns)
-            if not placemarks:
-                placemarks = root.findall('.//Placemark')
-            
-            for placemark in placemarks:
+            # Extract all geometry types, streaming placemarks instead of building the full tree
+            for placemark in iter_kml_placemarks(kml_file_path):
                 # Get name
-                name_elem = placemark.find('.//kml:name', ns)
-                if name_elem is None:
-                    name_elem = placemark.find('.//name')
+                name_elem = placemark.find('name')
                 name = name_elem.text if name_elem is not None else "Unnamed"
                 
                 # Look for Polygon
-                polygon_elem = placemark.find('.//kml:Polygon', ns)
-                if polygon_elem is None:
-                    polygon_elem = placemark.find('.//Polygon')
+                polygon_elem = self._find_geometry(placemark, 'Polygon')
                     
                 if polygon_elem is not None:
-                    coords_elem = polygon_elem.find('.//kml:coordinates', ns)
-                    if coords_elem is None:
-                        coords_elem = polygon_elem.find('.//coordinates')
+                    coords_elem = polygon_elem.find('outerBoundaryIs/LinearRing/coordinates')
                         
                     if coords_elem is not None:
                         coords_text = coords_elem.text.strip()
                         coords = self.parse_coordinates(coords_text)
                         if len(coords) >= 3:
-                            poly = Polygon(coords)
-                            geometries.append(poly)
+                            # Built after the loop, together with all other polygons
+                            polygon_slots.append(len(geometries))
+                            polygon_coords.append(coords)
+                            
+                            geometries.append(None)
                             names.append(name)
                             geom_types.append('Polygon')
                             continue
                 
                 # Look for LineString (route paths)
-                linestring_elem = placemark.find('.//kml:LineString', ns)
-                if linestring_elem is None:
-                    linestring_elem = placemark.find('.//LineString')
+                linestring_elem = self._find_geometry(placemark, 'LineString')
                     
                 if linestring_elem is not None:
-                    coords_elem = linestring_elem.find('.//kml:coordinates', ns)
-                    if coords_elem is None:
-                        coords_elem = linestring_elem.find('.//coordinates')
+                    coords_elem = linestring_elem.find('coordinates')
                         
                     if coords_elem is not None:
                         coords_text = coords_elem.text.strip()
                         coords = self.parse_coordinates(coords_text)
                         if len(coords) >= 2:
-                            from shapely.geometry import LineString
-                            import pyproj
-                            from pyproj import Transformer
-                            
-                            line = LineString(coords)
-                            
-                            # buffer_width is now in meters
-                            buffer_meters = buffer_width
-                            
-                            # Get the centroid to determine appropriate UTM zone
-                            centroid = line.centroid
-                            lon, lat = centroid.x, centroid.y
-                            
-                            # Calculate UTM zone
-                            utm_zone = int((lon + 180) / 6) + 1
-                            utm_crs = f"EPSG:326{utm_zone:02d}" if lat >= 0 else f"EPSG:327{utm_zone:02d}"
-                            
-                            try:
-                                # Transform to UTM for accurate meter-based buffering
-                                transformer_to_utm = Transformer.from_crs("EPSG:4326", utm_crs, always_xy=True)
-                                transformer_to_wgs = Transformer.from_crs(utm_crs, "EPSG:4326", always_xy=True)
-                                
-                                # Transform line to UTM
-                                from shapely.ops import transform
-                                line_utm = transform(transformer_to_utm.transform, line)
-                                
-                                # Buffer in meters
-                                self.progress.emit(f"  Buffering LineString by {buffer_meters}m using {utm_crs}")
-                                buffered_utm = line_utm.buffer(buffer_meters)
-                                
-                                # Transform back to WGS84
-                                buffered = transform(transformer_to_wgs.transform, buffered_utm)
-                                
-                            except Exception as e:
-                                # Fallback to degree-based buffering if UTM fails
-                                # Convert meters to approximate degrees (at equator)
-                                buffer_degrees = buffer_meters / 111320
-                                self.progress.emit(f"Warning: UTM transformation failed, using degree-based buffer ({buffer_degrees:.6f}°)")
-                                buffered = line.buffer(buffer_degrees)
+                            # Buffered after the loop, together with the other lines in its UTM zone
+                            line_slots.append(len(geometries))
+                            line_coords.append(coords)
                             
-                            geometries.append(buffered)
+                            geometries.append(None)
                             names.append(name)
                             geom_types.append('LineString (converted)')
                             continue
                 
                 # Look for Point
-                point_elem = placemark.find('.//kml:Point', ns)
-                if point_elem is None:
-                    point_elem = placemark.find('.//Point')
+                point_elem = self._find_geometry(placemark, 'Point')
                     
                 if point_elem is not None:
                     geom_types.append('Point (skipped)')
             
+            if polygon_coords:
+                coords, indices = stack_coords(polygon_coords)
+                polygons = shapely.polygons(shapely.linearrings(coords, indices=indices))
+                for slot, poly in zip(polygon_slots, polygons):
+                    geometries[slot] = poly
+            
+            if line_coords:
+                coords, indices = stack_coords(line_coords)
+                lines = shapely.linestrings(coords, indices=indices)
+                self._buffer_lines(lines, line_slots, geometries, buffer_width)
+            
             # Diagnostic information
             if not geometries:
                 found_types = ', '.join(set(geom_types)) if geom_types else 'None'
@@ -262,13 +462,14 @@ class ConversionThread(QThread):
                 )
             
             # Log what was found
-            self.progress.emit(f"Found {len(geometries)} geometries: {', '.join(geom_types)}")
+            self.report(f"Found {len(geometries)} geometries: {', '.join(geom_types)}")
             
-            # Create GeoDataFrame
+            # Create GeoDataFrame from a single geometry array
+            geom_array = np.empty(len(geometries), dtype=object)
+            geom_array[:] = geometries
             gdf = gpd.GeoDataFrame(
                 {'name': names, 'type': geom_types},
-                geometry=geometries,
-                crs='EPSG:4326'
+                geometry=gpd.GeoSeries(geom_array, crs='EPSG:4326')
             )
             
             return gdf
@@ -276,42 +477,114 @@ class ConversionThread(QThread):
         except Exception as e:
             raise Exception(f"Failed to parse KML: {str(e)}")
     
+    def _find_geometry(self, placemark, tag):
+        """Find a geometry element directly under the placemark or its MultiGeometry"""
+        elem = placemark.find(tag)
+        if elem is None:
+            elem = placemark.find(f'MultiGeometry/{tag}')
+        return elem
+    
+    def _buffer_lines(self, lines, line_slots, geometries, buffer_meters):
+        """Buffer LineStrings by buffer_meters, one batch per UTM zone
+        
+        Each buffered polygon is written back into geometries at its slot.
+        """
+        line_slots = np.asarray(line_slots)
+        
+        # Get the centroids to determine the appropriate UTM zone per line
+        centroids = shapely.centroid(lines)
+        lon, lat = shapely.get_x(centroids), shapely.get_y(centroids)
+        utm_zones = ((lon + 180) / 6).astype(int) + 1
+        epsg_codes = np.where(lat >= 0, 32600, 32700) + utm_zones
+        
+        for epsg in np.unique(epsg_codes):
+            in_zone = epsg_codes == epsg
+            zone_lines = lines[in_zone]
+            utm_crs = f"EPSG:{epsg}"
+            
+            try:
+                # Transform to UTM for accurate meter-based buffering
+                transformer_to_utm, transformer_to_wgs = get_utm_transformers(utm_crs)
+                
+                # Buffer in meters and transform back to WGS84
+                self.report(f"  Buffering {len(zone_lines)} LineString(s) by {buffer_meters}m using {utm_crs}")
+                buffered_utm = shapely.buffer(transform_geometry(zone_lines, transformer_to_utm), buffer_meters)
+                buffered = transform_geometry(buffered_utm, transformer_to_wgs)
+                
+            except Exception as e:
+                # Fallback to degree-based buffering if UTM fails
+                # Convert meters to approximate degrees (at equator)
+                buffer_degrees = buffer_meters / 111320
+                self.report(f"Warning: UTM transformation failed, using degree-based buffer ({buffer_degrees:.6f}°)")
+                buffered = shapely.buffer(zone_lines, buffer_degrees)
+            
+            for slot, geom in zip(line_slots[in_zone], buffered):
+                geometries[slot] = geom
+    
     def parse_coordinates(self, coords_text):
-        """Parse KML coordinates text"""
+        """Parse KML coordinates text into an (N, 2) array of lon/lat"""
+        first = coords_text.split(None, 1)
+        if not first:
+            return np.empty((0, 2))
+        
+        # Values per tuple (2 for lon,lat or 3 for lon,lat,alt), taken from the first tuple
+        ncols = first[0].count(',') + 1
+        if ncols >= 2:
+            values = np.fromstring(coords_text.replace(',', ' '), dtype=np.float64, sep=' ')
+            # Every tuple has the same width only if the comma count matches exactly;
+            # this also rejects text the C parser stopped on part-way
+            n_tuples, remainder = divmod(values.size, ncols)
+            if not remainder and coords_text.count(',') == n_tuples * (ncols - 1):
+                return values.reshape(n_tuples, ncols)[:, :2]
+        
+        # Tuples of mixed size or malformed text: parse one by one
         coords = []
         for line in coords_text.split():
             parts = line.split(',')
             if len(parts) >= 2:
                 lon, lat = float(parts[0]), float(parts[1])
                 coords.append((lon, lat))
-        return coords
+        return np.array(coords, dtype=np.float64).reshape(-1, 2)
     
     def simplify_geometries(self, gdf, tolerance, max_points):
-        """Simplify geometries to reduce point count"""
-        simplified = []
+        """Simplify geometries to reduce point count
         
-        for geom in gdf.geometry:
-            current_tolerance = tolerance
-            simplified_geom = geom.simplify(current_tolerance, preserve_topology=True)
+        Geometries still over max_points at the base tolerance get the smallest
+        tolerance (up to MAX_SIMPLIFY_TOLERANCE) that fits the budget, found by
+        bisection.
+        """
+        geoms = np.asarray(gdf.geometry.values)
+        simplified = simplify_array(geoms, tolerance, self.algorithm)
+        
+        over = shapely.get_num_coordinates(simplified) > max_points
+        if over.any() and tolerance < MAX_SIMPLIFY_TOLERANCE:
+            targets = geoms[over]
+            lo = np.full(len(targets), tolerance, dtype=np.float64)
+            hi = np.full(len(targets), MAX_SIMPLIFY_TOLERANCE, dtype=np.float64)
+            
+            # Coarsest result first, in case even the maximum tolerance is not enough
+            best = simplify_array(targets, hi, self.algorithm)
             
-            # Increase tolerance if still too many points
-            while self.count_points(simplified_geom) > max_points and current_tolerance < 0.1:
-                current_tolerance *= 1.5
-                simplified_geom = geom.simplify(current_tolerance, preserve_topology=True)
+            # Bisect in log space, since tolerances span several orders of magnitude
+            for _ in range(SIMPLIFY_BISECT_STEPS):
+                mid = np.sqrt(lo * hi)
+                candidate = simplify_array(targets, mid, self.algorithm)
+                fits = shapely.get_num_coordinates(candidate) <= max_points
+                best[fits] = candidate[fits]
+                hi = np.where(fits, mid, hi)
+                lo = np.where(fits, lo, mid)
             
-            simplified.append(simplified_geom)
+            simplified[over] = best
         
-        gdf_simplified = gdf.copy()
-        gdf_simplified.geometry = simplified
-        return gdf_simplified
+        return gdf.set_geometry(gpd.GeoSeries(simplified, index=gdf.index, crs=gdf.crs))
     
     def count_points(self, geom):
-        """Count total points in geometry"""
-        if isinstance(geom, Polygon):
-            return len(geom.exterior.coords)
-        elif isinstance(geom, MultiPolygon):
-            return sum([len(p.exterior.coords) for p in geom.geoms])
-        return 0
+        """Count total points in geometry (any type, including interior rings)"""
+        return int(shapely.get_num_coordinates(geom))
+
+
+# Features above this count are drawn without name labels
+MAX_LABELED_FEATURES = 50
 
 
 class MapCanvas(FigureCanvas):
@@ -340,12 +613,13 @@ class MapCanvas(FigureCanvas):
             gdf.plot(ax=self.ax, facecolor='lightblue', edgecolor='blue', 
                     alpha=0.5, linewidth=2)
             
-            # Add labels
-            for idx, row in gdf.iterrows():
-                centroid = row.geometry.centroid
-                self.ax.annotate(row['name'], xy=(centroid.x, centroid.y),
-                               xytext=(3, 3), textcoords="offset points",
-                               fontsize=9, color='darkblue')
+            # Add labels (skipped for large feature sets, where they are unreadable anyway)
+            if len(gdf) <= MAX_LABELED_FEATURES:
+                centroids = shapely.centroid(np.asarray(gdf.geometry.values))
+                for name, x, y in zip(gdf['name'], shapely.get_x(centroids), shapely.get_y(centroids)):
+                    self.ax.annotate(name, xy=(x, y),
+                                   xytext=(3, 3), textcoords="offset points",
+                                   fontsize=9, color='darkblue')
             
             # Get bounds and add some padding
             minx, miny, maxx, maxy = gdf.total_bounds
@@ -356,9 +630,7 @@ class MapCanvas(FigureCanvas):
             self.ax.set_ylim(miny - y_pad, maxy + y_pad)
             
             # Count total points
-            total_points = sum([len(geom.exterior.coords) if isinstance(geom, Polygon) else 
-                              sum([len(p.exterior.coords) for p in geom.geoms]) 
-                              for geom in gdf.geometry])
+            total_points = count_total_points(gdf.geometry.values)
             
             self.ax.set_title(f"Polygon Preview ({len(gdf)} features, {total_points} points)")
             self.ax.set_xlabel("Longitude")
@@ -455,6 +727,15 @@ class PolygonConverterApp(QMainWindow):
         tolerance_layout.addWidget(self.tolerance_spin)
         simplify_layout.addLayout(tolerance_layout)
         
+        algorithm_layout = QHBoxLayout()
+        algorithm_layout.addWidget(QLabel("Algorithm:"))
+        self.algorithm_combo = QComboBox()
+        self.algorithm_combo.addItem("Douglas-Peucker", 'dp')
+        self.algorithm_combo.addItem("Visvalingam-Whyatt", 'vw')
+        self.algorithm_combo.setToolTip("Visvalingam-Whyatt removes small spikes first and often\nkeeps route shapes better at high reduction")
+        algorithm_layout.addWidget(self.algorithm_combo)
+        simplify_layout.addLayout(algorithm_layout)
+        
         # Buffer width for LineString conversion
         simplify_layout.addWidget(QLabel("LineString Buffer (for route lines):"))
         buffer_layout = QHBoxLayout()
@@ -640,9 +921,7 @@ class PolygonConverterApp(QMainWindow):
                 return
             
             # Get statistics
-            total_points = sum([len(geom.exterior.coords) if isinstance(geom, Polygon) else 
-                              sum([len(p.exterior.coords) for p in geom.geoms]) 
-                              for geom in self.gdf.geometry])
+            total_points = count_total_points(self.gdf.geometry.values)
             
             self.log(f"Loaded {len(self.gdf)} feature(s)")
             self.log(f"Total points: {total_points}")
@@ -710,7 +989,8 @@ class PolygonConverterApp(QMainWindow):
             self.tolerance_spin.value(),
             self.max_points_spin.value(),
             self.buffer_spin.value(),
-            custom_name if custom_name else None
+            custom_name if custom_name else None,
+            self.algorithm_combo.currentData()
         )
         
         self.conversion_thread.progress.connect(self.log)
@@ -719,6 +999,14 @@ class PolygonConverterApp(QMainWindow):
     
     def conversion_finished(self, success, message):
         """Handle conversion completion"""
+        # Drop the worker before reporting, so the modal dialog below doesn't keep the
+        # finished thread alive. run() returns right after emitting, so this wait is short
+        thread = self.conversion_thread
+        self.conversion_thread = None
+        thread.wait()
+        thread.deleteLater()
+        release_memory()
+        
         self.convert_btn.setEnabled(True)
         
         if success:
@@ -733,8 +1021,18 @@ def main():
     app = QApplication(sys.argv)
     app.setStyle('Fusion')
     
-    # Set default font to Ubuntu with appropriate size
-    default_font = QFont("Ubuntu", 9)
+    # Compile (or load the cached) numba kernels in the background while the window opens,
+    # rather than on the first conversion
+    threading.Thread(target=visvalingam_whyatt, args=(np.zeros((4, 2)), 0.0, 4), daemon=True).start()
+    
+    # Set default font to Ubuntu with appropriate size, or the system font if it is not installed
+    if "Ubuntu" in QFontDatabase.families():
+        default_font = QFont("Ubuntu", 9)
+    else:
+        default_font = QFontDatabase.systemFont(QFontDatabase.SystemFont.GeneralFont)
+        default_font.setPointSize(9)
+    default_font.setStyleStrategy(QFont.StyleStrategy.PreferMatch)
+    default_font.setHintingPreference(QFont.HintingPreference.PreferFullHinting)
     app.setFont(default_font)
     
     window = PolygonConverterApp()
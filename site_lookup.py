@@ -1,21 +1,506 @@
 import sys
 import os
+import re
+import csv
+import json
+import hashlib
 import sqlite3
-import pandas as pd
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                               QHBoxLayout, QPushButton, QLineEdit, QLabel, 
                               QFileDialog, QMessageBox, QTextEdit, QProgressBar,
-                              QFrame, QGroupBox, QMenu)
-from PyQt6.QtCore import Qt, QCoreApplication, QTimer
-from PyQt6.QtGui import QFont, QKeySequence, QShortcut, QAction, QIcon
+                              QFrame, QGroupBox, QMenu, QCheckBox)
+from PyQt6.QtCore import Qt, QTimer, QThread, pyqtSignal
+from PyQt6.QtGui import QFont, QKeySequence, QShortcut, QAction, QIcon, QTextCursor
+
+
+# Source columns kept in the cache, in table order
+CACHE_COLUMNS = ['eNodeB Name', 'eNodeBID', 'Sub Region']
+
+
+def tune_connection(conn):
+    """Apply cache-friendly PRAGMAs to a cache connection"""
+    conn.execute("PRAGMA cache_size=-65536")      # 64 MiB page cache
+    conn.execute("PRAGMA mmap_size=268435456")    # Map up to 256 MiB of the file
+    conn.execute("PRAGMA temp_store=MEMORY")
+    return conn
+
+def source_fingerprint(file_path, block_size=4096):
+    """Cheap change check for a source file: BLAKE2b of its first and last blocks"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as f:
+        digest.update(f.read(block_size))
+        f.seek(max(os.fstat(f.fileno()).st_size - block_size, 0))
+        digest.update(f.read())
+    return digest.hexdigest()
+
+def clean_site_rows(rows):
+    """Normalise (eNodeB Name, eNodeBID, Sub Region) rows: all stripped, names upper-cased"""
+    for name, enodeb_id, region in rows:
+        yield str(name).strip().upper(), str(enodeb_id).strip(), str(region).strip()
+
+def unique_site_rows(rows):
+    """Keep only the first row for each eNodeB Name (cell-level dumps repeat the site per sector)"""
+    seen = set()
+    for row in rows:
+        if row[0] not in seen:
+            seen.add(row[0])
+            yield row
+
+
+class CacheLoadThread(QThread):
+    """Thread that reads a site database file and rebuilds the SQLite cache from it"""
+    finished = pyqtSignal(bool, str)
+    progress = pyqtSignal(int, str)
+    log = pyqtSignal(str, str)
+    missing_columns = pyqtSignal(list)
+    
+    def __init__(self, file_path, cache_db_path, meta_path):
+        super().__init__()
+        self.file_path = file_path
+        self.cache_db_path = cache_db_path
+        self.meta_path = meta_path
+    
+    def run(self):
+        try:
+            file_path = self.file_path
+            self.log.emit(f"Loading: {Path(file_path).name}", "INFO")
+            
+            if file_path.endswith('.csv'):
+                self.progress.emit(25, "Parsing CSV")
+                with open(file_path, encoding='utf-8-sig', newline='') as f:
+                    reader = csv.reader(f)
+                    header = next(reader, [])
+                    
+                    # Verify columns
+                    self.progress.emit(60, "Validating")
+                    missing_cols = [col for col in CACHE_COLUMNS if col not in header]
+                    if missing_cols:
+                        self.missing_columns.emit(missing_cols)
+                        return
+                    
+                    # Rows stream from the file straight into the cache
+                    self.progress.emit(85, "Caching")
+                    record_count = self.save_to_cache(self.csv_site_rows(reader, header))
+            else:
+                self.progress.emit(25, "Parsing Excel")
+                import pandas as pd  # Only the Excel path needs pandas; importing it is slow
+                # Only the lookup columns are parsed, all as text
+                wanted = CACHE_COLUMNS.__contains__
+                try:
+                    df = pd.read_excel(file_path, usecols=wanted, dtype=str, engine='calamine')
+                except (ImportError, ValueError):
+                    # python-calamine not installed, or pandas < 2.2 ("Unknown engine: calamine")
+                    df = pd.read_excel(file_path, usecols=wanted, dtype=str, engine='openpyxl')
+                
+                self.progress.emit(50, "Processing data")
+                
+                # Verify columns
+                self.progress.emit(60, "Validating")
+                missing_cols = [col for col in CACHE_COLUMNS if col not in df.columns]
+                if missing_cols:
+                    self.missing_columns.emit(missing_cols)
+                    return
+                
+                self.progress.emit(70, "Cleaning data")
+                self.source_rows = len(df)
+                df = df.dropna(subset=['eNodeB Name'])
+                self.null_rows = self.source_rows - len(df)
+                
+                self.progress.emit(85, "Caching")
+                record_count = self.save_to_cache(df[CACHE_COLUMNS].itertuples(index=False, name=None))
+            
+            self.log.emit(f"Loaded {self.source_rows:,} rows", "INFO")
+            if self.null_rows > 0:
+                self.log.emit(f"Removed {self.null_rows} null records", "WARNING")
+            if record_count < self.source_rows - self.null_rows:
+                self.log.emit(f"Deduped: kept {record_count:,} unique sites", "INFO")
+            self.log.emit(f"Cache saved: {record_count:,} records", "SUCCESS")
+            self.finished.emit(True, "")
+            
+        except Exception as e:
+            self.finished.emit(False, str(e))
+    
+    def csv_site_rows(self, reader, header):
+        """(eNodeB Name, eNodeBID, Sub Region) from CSV rows, counting rows read and rows without a name"""
+        name_col, id_col, region_col = (header.index(col) for col in CACHE_COLUMNS)
+        width = len(header)
+        self.source_rows = self.null_rows = 0
+        for row in reader:
+            self.source_rows += 1
+            if len(row) < width:
+                row += [''] * (width - len(row))
+            if not row[name_col]:
+                self.null_rows += 1
+                continue
+            # Blank fields read as 'nan', as on the pandas (Excel) path
+            yield row[name_col], row[id_col] or 'nan', row[region_col] or 'nan'
+    
+    def save_to_cache(self, rows):
+        """Save (eNodeB Name, eNodeBID, Sub Region) rows to the SQLite cache; returns the cached row count"""
+        try:
+            self.log.emit("Saving to cache...", "INFO")
+            
+            # Create SQLite database; the cache can always be rebuilt from the source
+            # file, so the bulk load skips fsyncs
+            conn = tune_connection(sqlite3.connect(self.cache_db_path))
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=OFF")
+            
+            # Save data: bulk insert into a staging table, then rebuild the table clustered by
+            # region, all in one transaction. source_row keeps the file order lookups report
+            cursor = conn.cursor()
+            cursor.execute("BEGIN")
+            cursor.execute('CREATE TEMP TABLE sites_load ("eNodeB Name" TEXT, eNodeBID TEXT, "Sub Region" TEXT, source_row INTEGER)')
+            rows = unique_site_rows(clean_site_rows(rows))
+            cursor.executemany("INSERT INTO sites_load VALUES (?, ?, ?, ?)",
+                               (row + (source_row,) for source_row, row in enumerate(rows)))
+            cursor.execute("DROP TABLE IF EXISTS sites")
+            cursor.execute('CREATE TABLE sites AS SELECT * FROM sites_load ORDER BY "Sub Region", "eNodeB Name"')
+            cursor.execute("DROP TABLE sites_load")
+            record_count = cursor.execute("SELECT COUNT(*) FROM sites").fetchone()[0]
+            
+            # Metadata lives in the JSON sidecar; drop the table older caches kept it in
+            cursor.execute("DROP TABLE IF EXISTS metadata")
+            
+            # Create a covering index for faster searches (after the insert, so it is built
+            # in one pass); lookups are answered from the index alone
+            cursor.execute('CREATE INDEX idx_enodeb_cover ON sites ("eNodeB Name", eNodeBID, "Sub Region", source_row)')
+            
+            conn.commit()
+            conn.close()
+            
+            # Save metadata
+            self.meta_path.write_text(json.dumps({
+                'source_file': self.file_path,
+                'import_date': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                'record_count': record_count,
+                'source_size': os.path.getsize(self.file_path),
+                'source_fingerprint': source_fingerprint(self.file_path),
+            }))
+            
+            return record_count
+            
+        except Exception as e:
+            self.log.emit(f"Failed to save cache: {str(e)}", "ERROR")
+            raise
+
 
 class CachedSiteLookup(QMainWindow):
+    # Site separators in the search box: commas, pipes, "or" and whitespace
+    SPLIT_RE = re.compile(r'\s*(?:,|\bOR\b|\||\s+)\s*', re.IGNORECASE)
+    
+    # Exact lookups for every searched site run as one statement through the eNodeB Name index
+    EXACT_LOOKUP_SQL = """
+        SELECT "eNodeB Name", eNodeBID, "Sub Region"
+        FROM sites WHERE "eNodeB Name" IN ({}) ORDER BY source_row
+    """
+    # Partial lookups return the first row in file order plus the total number of matching rows
+    PARTIAL_LOOKUP_SQL = """
+        SELECT eNodeBID, "Sub Region", COUNT(*) OVER ()
+        FROM sites WHERE instr("eNodeB Name", ?) > 0 ORDER BY source_row LIMIT 1
+    """
+    
+    # Lookup results kept per cache connection, least recently used evicted first
+    SEARCH_CACHE_SIZE = 4096
+    
+    # Enhanced Windows Classic style, built once per process
+    STYLESHEET = """
+        QMainWindow {
+            background-color: #ECE9D8;
+        }
+        
+        /* Enhanced Classic Buttons */
+        QPushButton {
+            background-color: #D4D0C8;
+            border-top: 2px solid #FFFFFF;
+            border-left: 2px solid #FFFFFF;
+            border-right: 2px solid #808080;
+            border-bottom: 2px solid #808080;
+            border-radius: 0px;
+            padding: 4px 10px;
+            font-family: 'Ubuntu', 'Segoe UI', 'Tahoma', sans-serif;
+            font-size: 9pt;
+            font-weight: 600;
+            color: #000000;
+            min-height: 20px;
+        }
+        QPushButton:hover {
+            background-color: #E8E5DD;
+        }
+        QPushButton:pressed {
+            border-top: 2px solid #808080;
+            border-left: 2px solid #808080;
+            border-right: 2px solid #FFFFFF;
+            border-bottom: 2px solid #FFFFFF;
+            background-color: #C0BEB0;
+            padding: 5px 9px 3px 11px;
+        }
+        QPushButton:disabled {
+            color: #999999;
+            background-color: #D4D0C8;
+        }
+        QPushButton#primaryBtn {
+            background-color: #5B8BB9;
+            font-weight: bold;
+            color: #FFFFFF;
+        }
+        QPushButton#primaryBtn:hover {
+            background-color: #6A9BC9;
+            color: #FFFFFF;
+        }
+        QPushButton#primaryBtn:pressed {
+            background-color: #4A7AA8;
+            color: #FFFFFF;
+        }
+        QPushButton#compactBtn {
+            padding: 2px 6px;
+            font-size: 8pt;
+            min-height: 16px;
+        }
+        
+        QLineEdit {
+            background-color: #FFFFFF;
+            border-top: 2px solid #7F9DB9;
+            border-left: 2px solid #7F9DB9;
+            border-right: 2px solid #E3E3E3;
+            border-bottom: 2px solid #E3E3E3;
+            padding: 3px 4px;
+            font-family: 'Ubuntu', 'Segoe UI', 'Tahoma', sans-serif;
+            font-size: 9pt;
+            color: #000000;
+            selection-background-color: #316AC5;
+            selection-color: #FFFFFF;
+        }
+        QLineEdit:disabled {
+            background-color: #E8E5DD;
+            color: #999999;
+            border-top: 2px solid #999999;
+            border-left: 2px solid #999999;
+        }
+        QLineEdit:focus {
+            background-color: #FFFFEE;
+            border-top: 2px solid #5B8BB9;
+            border-left: 2px solid #5B8BB9;
+        }
+        
+        QLabel {
+            background-color: transparent;
+            font-family: 'Ubuntu', 'Segoe UI', 'Tahoma', sans-serif;
+            font-size: 9pt;
+            color: #000000;
+        }
+        
+        QGroupBox {
+            background-color: #ECE9D8;
+            border-top: 2px solid #FFFFFF;
+            border-left: 2px solid #FFFFFF;
+            border-right: 2px solid #808080;
+            border-bottom: 2px solid #808080;
+            border-radius: 0px;
+            margin-top: 8px;
+            padding-top: 8px;
+            font-family: 'Ubuntu', 'Segoe UI', 'Tahoma', sans-serif;
+            font-size: 9pt;
+            font-weight: bold;
+            color: #000066;
+        }
+        QGroupBox::title {
+            subcontrol-origin: margin;
+            subcontrol-position: top left;
+            left: 8px;
+            padding: 0 3px;
+            background-color: #ECE9D8;
+        }
+        
+        QFrame#resultPanel {
+            background-color: #FFFFFF;
+            border-top: 2px solid #808080;
+            border-left: 2px solid #808080;
+            border-right: 2px solid #E3E3E3;
+            border-bottom: 2px solid #E3E3E3;
+        }
+        
+        QFrame#statusBar {
+            background-color: #D4D0C8;
+            border-top: 2px solid #FFFFFF;
+            border-bottom: 1px solid #808080;
+        }
+        
+        QProgressBar {
+            border-top: 2px solid #808080;
+            border-left: 2px solid #808080;
+            border-right: 2px solid #E3E3E3;
+            border-bottom: 2px solid #E3E3E3;
+            background-color: #FFFFFF;
+            text-align: center;
+            font-family: 'Ubuntu', 'Segoe UI', 'Tahoma', sans-serif;
+            font-size: 8pt;
+            color: #000000;
+            height: 18px;
+        }
+        QProgressBar::chunk {
+            background-color: #316AC5;
+            border: 1px solid #5B8BB9;
+        }
+        
+        QTextEdit {
+            background-color: #FFFFFF;
+            border-top: 2px solid #808080;
+            border-left: 2px solid #808080;
+            border-right: 2px solid #E3E3E3;
+            border-bottom: 2px solid #E3E3E3;
+            font-family: 'Ubuntu Mono', 'Consolas', 'Courier New', monospace;
+            font-size: 8pt;
+            color: #000000;
+            padding: 2px;
+        }
+        
+        QMenu {
+            background-color: #FFFFFF;
+            border: 2px solid #808080;
+            padding: 2px;
+            font-family: 'Ubuntu', 'Segoe UI', 'Tahoma', sans-serif;
+            font-size: 9pt;
+        }
+        QMenu::item {
+            padding: 3px 20px;
+            background-color: transparent;
+            color: #000000;
+        }
+        QMenu::item:selected {
+            background-color: #316AC5;
+            color: #FFFFFF;
+        }
+        
+        /* Named widgets */
+        QFrame#footerBar {
+            background-color: #D4D0C8;
+            border-top: 1px solid #FFFFFF;
+        }
+        
+        QLabel#resultsHeader {
+            font-weight: bold;
+            color: #000066;
+            font-size: 9pt;
+            border-bottom: 1px solid #D4D0C8;
+            padding-bottom: 2px;
+        }
+        
+        QLabel#enodebIcon {
+            color: #316AC5;
+            font-size: 10pt;
+        }
+        
+        QLabel#fieldLabel {
+            color: #000000;
+            font-weight: 600;
+        }
+        
+        QLineEdit#enodebValue {
+            color: #000080;
+            font-weight: bold;
+            font-size: 10pt;
+            font-family: 'Consolas', 'Courier New', monospace;
+            background-color: #FFFFFF;
+            border: 1px solid #D4D0C8;
+            padding: 2px 4px;
+        }
+        
+        QLabel#regionIcon {
+            color: #CC3333;
+            font-size: 10pt;
+        }
+        
+        QLineEdit#regionValue {
+            color: #800000;
+            font-weight: bold;
+            font-size: 10pt;
+            font-family: 'Consolas', 'Courier New', monospace;
+            background-color: #FFFFFF;
+            border: 1px solid #D4D0C8;
+            padding: 2px 4px;
+        }
+        
+        QLabel#statusMessage {
+            color: #000000;
+            font-size: 8pt;
+            background: transparent;
+            border: none;
+        }
+        
+        QLabel#cacheIndicator {
+            font-size: 9pt;
+        }
+        
+        QLabel#counterLabel {
+            color: #666666;
+            font-size: 8pt;
+        }
+        
+        QLabel#searchCount {
+            color: #000000;
+            font-size: 8pt;
+            font-weight: bold;
+            background: transparent;
+            border: none;
+        }
+        
+        QLabel#footerLabel {
+            color: #666666;
+            font-size: 7pt;
+            font-weight: italic;
+            font-family: 'Ubuntu', 'Segoe UI', 'Tahoma', sans-serif;
+        }
+        
+        QLabel#logHeader {
+            font-weight: bold;
+            font-size: 8pt;
+            color: #000066;
+        }
+    """
+    
+    # Log lines kept until the log panel shows them; the open panel is refreshed
+    # at most every LOG_FLUSH_INTERVAL_MS
+    LOG_BUFFER_SIZE = 500
+    LOG_FLUSH_INTERVAL_MS = 100
+    
+    # Status bar changes are coalesced; only the latest in each window reaches the widgets
+    STATUS_UPDATE_INTERVAL_MS = 50
+    
+    LOG_COLORS = {
+        "INFO": "#0066CC",
+        "SUCCESS": "#008800",
+        "WARNING": "#CC6600",
+        "ERROR": "#CC0000",
+        "DEBUG": "#666666"
+    }
+    LOG_ENTRY_HTML = ('<span style="color: #666666;">[{timestamp}]</span> '
+                      '<span style="color: {color}; font-weight: bold;">[{level}]</span> {message}')
+    
     def __init__(self):
         super().__init__()
-        self.df = None
+        self.load_thread = None
+        self.conn = None
+        self.record_count = 0
+        self.search_cache = {}
+        self.search_cache_hits = 0
+        self.search_cache_misses = 0
         self.log_visible = False
+        self.log_details = False  # Log every term of a search, not just the summary
+        self.log_buffer = deque(maxlen=self.LOG_BUFFER_SIZE)
+        self.log_timer = QTimer(self)
+        self.log_timer.setSingleShot(True)
+        self.log_timer.setInterval(self.LOG_FLUSH_INTERVAL_MS)
+        self.log_timer.timeout.connect(self.flush_log)
+        self.pending_status_color = None
+        self.pending_status_message = None
+        self.status_timer = QTimer(self)
+        self.status_timer.setSingleShot(True)
+        self.status_timer.setInterval(self.STATUS_UPDATE_INTERVAL_MS)
+        self.status_timer.timeout.connect(self.apply_status)
         self.database_path = None
         self.cache_db_path = None
         self.search_count = 0
@@ -24,6 +509,7 @@ class CachedSiteLookup(QMainWindow):
         self.cache_dir = Path.home() / ".site_lookup_cache"
         self.cache_dir.mkdir(exist_ok=True)
         self.cache_db_path = self.cache_dir / "site_database.db"
+        self.meta_path = self.cache_dir / "metadata.json"
         
         self.init_ui()
         self.setup_shortcuts()
@@ -42,175 +528,7 @@ class CachedSiteLookup(QMainWindow):
         if icon_path.exists():
             self.setWindowIcon(QIcon(str(icon_path)))
         
-        # Enhanced Windows Classic style
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #ECE9D8;
-            }
-            
-            /* Enhanced Classic Buttons */
-            QPushButton {
-                background-color: #D4D0C8;
-                border-top: 2px solid #FFFFFF;
-                border-left: 2px solid #FFFFFF;
-                border-right: 2px solid #808080;
-                border-bottom: 2px solid #808080;
-                border-radius: 0px;
-                padding: 4px 10px;
-                font-family: 'Ubuntu', 'Segoe UI', 'Tahoma', sans-serif;
-                font-size: 9pt;
-                font-weight: 600;
-                color: #000000;
-                min-height: 20px;
-            }
-            QPushButton:hover {
-                background-color: #E8E5DD;
-            }
-            QPushButton:pressed {
-                border-top: 2px solid #808080;
-                border-left: 2px solid #808080;
-                border-right: 2px solid #FFFFFF;
-                border-bottom: 2px solid #FFFFFF;
-                background-color: #C0BEB0;
-                padding: 5px 9px 3px 11px;
-            }
-            QPushButton:disabled {
-                color: #999999;
-                background-color: #D4D0C8;
-            }
-            QPushButton#primaryBtn {
-                background-color: #5B8BB9;
-                font-weight: bold;
-                color: #FFFFFF;
-            }
-            QPushButton#primaryBtn:hover {
-                background-color: #6A9BC9;
-                color: #FFFFFF;
-            }
-            QPushButton#primaryBtn:pressed {
-                background-color: #4A7AA8;
-                color: #FFFFFF;
-            }
-            QPushButton#compactBtn {
-                padding: 2px 6px;
-                font-size: 8pt;
-                min-height: 16px;
-            }
-            
-            QLineEdit {
-                background-color: #FFFFFF;
-                border-top: 2px solid #7F9DB9;
-                border-left: 2px solid #7F9DB9;
-                border-right: 2px solid #E3E3E3;
-                border-bottom: 2px solid #E3E3E3;
-                padding: 3px 4px;
-                font-family: 'Ubuntu', 'Segoe UI', 'Tahoma', sans-serif;
-                font-size: 9pt;
-                color: #000000;
-                selection-background-color: #316AC5;
-                selection-color: #FFFFFF;
-            }
-            QLineEdit:disabled {
-                background-color: #E8E5DD;
-                color: #999999;
-                border-top: 2px solid #999999;
-                border-left: 2px solid #999999;
-            }
-            QLineEdit:focus {
-                background-color: #FFFFEE;
-                border-top: 2px solid #5B8BB9;
-                border-left: 2px solid #5B8BB9;
-            }
-            
-            QLabel {
-                background-color: transparent;
-                font-family: 'Ubuntu', 'Segoe UI', 'Tahoma', sans-serif;
-                font-size: 9pt;
-                color: #000000;
-            }
-            
-            QGroupBox {
-                background-color: #ECE9D8;
-                border-top: 2px solid #FFFFFF;
-                border-left: 2px solid #FFFFFF;
-                border-right: 2px solid #808080;
-                border-bottom: 2px solid #808080;
-                border-radius: 0px;
-                margin-top: 8px;
-                padding-top: 8px;
-                font-family: 'Ubuntu', 'Segoe UI', 'Tahoma', sans-serif;
-                font-size: 9pt;
-                font-weight: bold;
-                color: #000066;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                left: 8px;
-                padding: 0 3px;
-                background-color: #ECE9D8;
-            }
-            
-            QFrame#resultPanel {
-                background-color: #FFFFFF;
-                border-top: 2px solid #808080;
-                border-left: 2px solid #808080;
-                border-right: 2px solid #E3E3E3;
-                border-bottom: 2px solid #E3E3E3;
-            }
-            
-            QFrame#statusBar {
-                background-color: #D4D0C8;
-                border-top: 2px solid #FFFFFF;
-                border-bottom: 1px solid #808080;
-            }
-            
-            QProgressBar {
-                border-top: 2px solid #808080;
-                border-left: 2px solid #808080;
-                border-right: 2px solid #E3E3E3;
-                border-bottom: 2px solid #E3E3E3;
-                background-color: #FFFFFF;
-                text-align: center;
-                font-family: 'Ubuntu', 'Segoe UI', 'Tahoma', sans-serif;
-                font-size: 8pt;
-                color: #000000;
-                height: 18px;
-            }
-            QProgressBar::chunk {
-                background-color: #316AC5;
-                border: 1px solid #5B8BB9;
-            }
-            
-            QTextEdit {
-                background-color: #FFFFFF;
-                border-top: 2px solid #808080;
-                border-left: 2px solid #808080;
-                border-right: 2px solid #E3E3E3;
-                border-bottom: 2px solid #E3E3E3;
-                font-family: 'Ubuntu Mono', 'Consolas', 'Courier New', monospace;
-                font-size: 8pt;
-                color: #000000;
-                padding: 2px;
-            }
-            
-            QMenu {
-                background-color: #FFFFFF;
-                border: 2px solid #808080;
-                padding: 2px;
-                font-family: 'Ubuntu', 'Segoe UI', 'Tahoma', sans-serif;
-                font-size: 9pt;
-            }
-            QMenu::item {
-                padding: 3px 20px;
-                background-color: transparent;
-                color: #000000;
-            }
-            QMenu::item:selected {
-                background-color: #316AC5;
-                color: #FFFFFF;
-            }
-        """)
+        self.setStyleSheet(self.STYLESHEET)
         
         # Central widget
         central_widget = QWidget()
@@ -276,13 +594,7 @@ class CachedSiteLookup(QMainWindow):
         results_layout.setSpacing(4)
         
         results_header = QLabel("Site Information")
-        results_header.setStyleSheet("""
-            font-weight: bold;
-            color: #000066;
-            font-size: 9pt;
-            border-bottom: 1px solid #D4D0C8;
-            padding-bottom: 2px;
-        """)
+        results_header.setObjectName("resultsHeader")
         results_layout.addWidget(results_header)
         
         # eNodeBID row
@@ -290,23 +602,15 @@ class CachedSiteLookup(QMainWindow):
         enodeb_container.setSpacing(8)
         
         enodeb_icon = QLabel("●")
-        enodeb_icon.setStyleSheet("color: #316AC5; font-size: 10pt;")
+        enodeb_icon.setObjectName("enodebIcon")
         
         enodeb_label = QLabel("eNodeB ID:")
         enodeb_label.setMinimumWidth(70)
-        enodeb_label.setStyleSheet("color: #000000; font-weight: 600;")
+        enodeb_label.setObjectName("fieldLabel")
         
         self.enodeb_value = QLineEdit("")
         self.enodeb_value.setReadOnly(True)
-        self.enodeb_value.setStyleSheet("""
-            color: #000080;
-            font-weight: bold;
-            font-size: 10pt;
-            font-family: 'Consolas', 'Courier New', monospace;
-            background-color: #FFFFFF;
-            border: 1px solid #D4D0C8;
-            padding: 2px 4px;
-        """)
+        self.enodeb_value.setObjectName("enodebValue")
         
         enodeb_container.addWidget(enodeb_icon)
         enodeb_container.addWidget(enodeb_label)
@@ -318,23 +622,15 @@ class CachedSiteLookup(QMainWindow):
         region_container.setSpacing(8)
         
         region_icon = QLabel("●")
-        region_icon.setStyleSheet("color: #CC3333; font-size: 10pt;")
+        region_icon.setObjectName("regionIcon")
         
         region_label = QLabel("Region:")
         region_label.setMinimumWidth(70)
-        region_label.setStyleSheet("color: #000000; font-weight: 600;")
+        region_label.setObjectName("fieldLabel")
         
         self.region_value = QLineEdit("")
         self.region_value.setReadOnly(True)
-        self.region_value.setStyleSheet("""
-            color: #800000;
-            font-weight: bold;
-            font-size: 10pt;
-            font-family: 'Consolas', 'Courier New', monospace;
-            background-color: #FFFFFF;
-            border: 1px solid #D4D0C8;
-            padding: 2px 4px;
-        """)
+        self.region_value.setObjectName("regionValue")
         
         region_container.addWidget(region_icon)
         region_container.addWidget(region_label)
@@ -356,36 +652,25 @@ class CachedSiteLookup(QMainWindow):
         status_layout.addWidget(self.status_led)
         
         self.status_message = QLabel("Loading cache...")
-        self.status_message.setStyleSheet("""
-            color: #000000;
-            font-size: 8pt;
-            background: transparent;
-            border: none;
-        """)
+        self.status_message.setObjectName("statusMessage")
         status_layout.addWidget(self.status_message)
         
         status_layout.addStretch()
         
         # Cache indicator
         self.cache_indicator = QLabel("💾")
-        self.cache_indicator.setStyleSheet("font-size: 9pt;")
+        self.cache_indicator.setObjectName("cacheIndicator")
         self.cache_indicator.setToolTip("Using cached database")
         self.cache_indicator.setVisible(False)
         status_layout.addWidget(self.cache_indicator)
         
         # Search counter
         counter_label = QLabel("Searches:")
-        counter_label.setStyleSheet("color: #666666; font-size: 8pt;")
+        counter_label.setObjectName("counterLabel")
         status_layout.addWidget(counter_label)
         
         self.search_count_label = QLabel("0")
-        self.search_count_label.setStyleSheet("""
-            color: #000000;
-            font-size: 8pt;
-            font-weight: bold;
-            background: transparent;
-            border: none;
-        """)
+        self.search_count_label.setObjectName("searchCount")
         status_layout.addWidget(self.search_count_label)
         
         # Log toggle
@@ -400,59 +685,20 @@ class CachedSiteLookup(QMainWindow):
         # === FOOTER MESSAGE ===
         footer_frame = QFrame()
         footer_frame.setObjectName("footerBar")
-        footer_frame.setStyleSheet("""
-            QFrame#footerBar {
-                background-color: #D4D0C8;
-                border-top: 1px solid #FFFFFF;
-            }
-        """)
         footer_layout = QHBoxLayout(footer_frame)
         footer_layout.setContentsMargins(6, 2, 6, 2)
         
         footer_label = QLabel("V1.0.4025. Fadzli Abdullah. Huawei Technologies")
-        footer_label.setStyleSheet("""
-            color: #666666;
-            font-size: 7pt;
-            font-weight: italic;
-            font-family: 'Ubuntu', 'Segoe UI', 'Tahoma', sans-serif;
-        """)
+        footer_label.setObjectName("footerLabel")
         footer_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         footer_layout.addWidget(footer_label)
         
         layout.addWidget(footer_frame)
         
-        # === LOG PANEL ===
-        log_container = QWidget()
-        log_layout = QVBoxLayout(log_container)
-        log_layout.setContentsMargins(0, 4, 0, 0)
-        log_layout.setSpacing(2)
-        
-        log_header_row = QHBoxLayout()
-        log_header = QLabel("Processing Log")
-        log_header.setStyleSheet("""
-            font-weight: bold;
-            font-size: 8pt;
-            color: #000066;
-        """)
-        log_header_row.addWidget(log_header)
-        
-        log_clear_btn = QPushButton("Clear Log")
-        log_clear_btn.setObjectName("compactBtn")
-        log_clear_btn.setMaximumWidth(70)
-        log_clear_btn.clicked.connect(lambda: self.log_text.clear())
-        log_header_row.addWidget(log_clear_btn)
-        log_header_row.addStretch()
-        
-        log_layout.addLayout(log_header_row)
-        
-        self.log_text = QTextEdit()
-        self.log_text.setReadOnly(True)
-        self.log_text.setMaximumHeight(130)
-        log_layout.addWidget(self.log_text)
-        
-        layout.addWidget(log_container)
-        self.log_container = log_container
-        log_container.hide()
+        # === LOG PANEL === (built on first open)
+        self.main_layout = layout
+        self.log_container = None
+        self.log_text = None
         
         self.search_btn = None
     
@@ -511,23 +757,65 @@ class CachedSiteLookup(QMainWindow):
         pass
     
     def add_log(self, message, level="INFO"):
-        """Add log entry"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        color_map = {
-            "INFO": "#0066CC",
-            "SUCCESS": "#008800",
-            "WARNING": "#CC6600",
-            "ERROR": "#CC0000",
-            "DEBUG": "#666666"
-        }
-        color = color_map.get(level, "#000000")
+        """Add log entry; it reaches the log panel on the next flush"""
+        self.log_buffer.append(self.LOG_ENTRY_HTML.format_map({
+            'timestamp': datetime.now().strftime("%H:%M:%S"),
+            'color': self.LOG_COLORS.get(level, "#000000"),
+            'level': level,
+            'message': message,
+        }))
+        if self.log_text is not None and not self.log_timer.isActive():
+            self.log_timer.start()
+    
+    def flush_log(self):
+        """Write buffered log entries to the log panel in one insert"""
+        if self.log_text is None or not self.log_buffer:
+            return
         
-        log_entry = f'<span style="color: #666666;">[{timestamp}]</span> <span style="color: {color}; font-weight: bold;">[{level}]</span> {message}'
-        self.log_text.append(log_entry)
+        cursor = QTextCursor(self.log_text.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        html = "<br>".join(self.log_buffer)
+        cursor.insertHtml(html if self.log_text.document().isEmpty() else "<br>" + html)
+        self.log_buffer.clear()
         
         scrollbar = self.log_text.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
     
+    def build_log_panel(self):
+        """Create the log panel and fill it with the lines logged so far"""
+        log_container = QWidget()
+        log_layout = QVBoxLayout(log_container)
+        log_layout.setContentsMargins(0, 4, 0, 0)
+        log_layout.setSpacing(2)
+        
+        log_header_row = QHBoxLayout()
+        log_header = QLabel("Processing Log")
+        log_header.setObjectName("logHeader")
+        log_header_row.addWidget(log_header)
+        
+        log_clear_btn = QPushButton("Clear Log")
+        log_clear_btn.setObjectName("compactBtn")
+        log_clear_btn.setMaximumWidth(70)
+        log_clear_btn.clicked.connect(lambda: self.log_text.clear())
+        log_header_row.addWidget(log_clear_btn)
+        
+        log_details_check = QCheckBox("Per-site details")
+        log_details_check.setChecked(self.log_details)
+        log_details_check.toggled.connect(lambda checked: setattr(self, 'log_details', checked))
+        log_header_row.addWidget(log_details_check)
+        log_header_row.addStretch()
+        
+        log_layout.addLayout(log_header_row)
+        
+        self.log_text = QTextEdit()
+        self.log_text.setReadOnly(True)
+        self.log_text.setMaximumHeight(130)
+        log_layout.addWidget(self.log_text)
+        
+        self.main_layout.addWidget(log_container)
+        self.log_container = log_container
+        self.flush_log()
+    
     def update_progress(self, value, text=""):
         """Update progress bar"""
         self.progress_bar.setValue(value)
@@ -535,24 +823,41 @@ class CachedSiteLookup(QMainWindow):
             self.progress_bar.setFormat(f"{value}% - {text}")
         else:
             self.progress_bar.setFormat(f"{value}%")
-        QCoreApplication.processEvents()
     
     def update_status_led(self, color="red", message=""):
-        """Update LED indicator"""
+        """Update LED indicator (applied on the next status update)"""
+        self.pending_status_color = color
+        if message:
+            self.pending_status_message = message
+        self.status_timer.start()
+    
+    def update_status_message(self, message):
+        """Update the status message (applied on the next status update)"""
+        self.pending_status_message = message
+        self.status_timer.start()
+    
+    def apply_status(self):
+        """Push the latest LED colour, status message and search count to the status bar"""
         color_map = {
             "red": "#CC3333",
             "green": "#33CC33",
             "yellow": "#CCCC33",
             "blue": "#3366CC"
         }
-        self.status_led.setStyleSheet(f"color: {color_map.get(color, '#CC3333')}; font-size: 9pt;")
-        if message:
-            self.status_message.setText(message)
+        if self.pending_status_color is not None:
+            self.status_led.setStyleSheet(f"color: {color_map.get(self.pending_status_color, '#CC3333')}; font-size: 9pt;")
+            self.pending_status_color = None
+        if self.pending_status_message is not None:
+            self.status_message.setText(self.pending_status_message)
+            self.pending_status_message = None
+        self.search_count_label.setText(str(self.search_count))
     
     def toggle_log(self):
         """Toggle log panel"""
         self.log_visible = not self.log_visible
         if self.log_visible:
+            if self.log_container is None:
+                self.build_log_panel()
             self.log_container.show()
             self.toggle_log_btn.setText("▲ Log")
             self.resize(380, 450)
@@ -566,7 +871,7 @@ class CachedSiteLookup(QMainWindow):
         """Clear search results"""
         self.enodeb_value.setText("-")
         self.region_value.setText("-")
-        self.status_message.setText(f"Ready: {len(self.df):,} records" if self.df is not None else "No database loaded")
+        self.update_status_message(f"Ready: {self.record_count:,} records" if self.conn is not None else "No database loaded")
         self.search_input.clear()
         self.search_input.setFocus()
         self.clear_btn.setEnabled(False)
@@ -578,16 +883,82 @@ class CachedSiteLookup(QMainWindow):
             self.search_input.clear()
             self.search_input.setFocus()
     
+    def connect_cache(self, read_only=True):
+        """Open a tuned connection to the cache database"""
+        if read_only:
+            conn = sqlite3.connect(f"{self.cache_db_path.as_uri()}?mode=ro", uri=True)
+        else:
+            conn = sqlite3.connect(self.cache_db_path)
+        return tune_connection(conn)
+    
+    def open_cache(self):
+        """Open the cache connection used for searches"""
+        self.close_cache()
+        self.conn = self.connect_cache()
+        columns = [row[1] for row in self.conn.execute("PRAGMA table_info(sites)")]
+        if "source_row" not in columns:
+            self.close_cache()
+            raise ValueError("Cache was built by an older version - please reload the database")
+        self.record_count = self.conn.execute("SELECT COUNT(*) FROM sites").fetchone()[0]
+        # Fresh memo per connection, so results never outlive the data they came from
+        self.search_cache = {}
+        self.search_cache_hits = 0
+        self.search_cache_misses = 0
+    
+    def close_cache(self):
+        """Close the search connection, if open"""
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+            self.search_cache = {}
+    
+    def lookup_sites(self, search_terms):
+        """Look up sites through the search cache: {term: (result, match type)}, (None, None) if not found
+        
+        Exact matches for all uncached terms are fetched in one query; the rest fall back to
+        partial matching one by one.
+        """
+        cache = self.search_cache
+        results = {}
+        misses = []
+        for term in dict.fromkeys(search_terms):
+            if term in cache:
+                results[term] = cache[term] = cache.pop(term)  # Move to most recently used
+            else:
+                misses.append(term)
+        
+        if misses:
+            exact_results = self.query_sites(misses)
+            for term in misses:
+                if term in exact_results:
+                    results[term] = (exact_results[term], "exact")
+                else:
+                    result = self.query_site(term)
+                    results[term] = (result, "partial") if result is not None else (None, None)
+                cache[term] = results[term]
+            while len(cache) > self.SEARCH_CACHE_SIZE:
+                del cache[next(iter(cache))]
+        
+        self.search_cache_hits += len(results) - len(misses)
+        self.search_cache_misses += len(misses)
+        return results
+    
+    def query_sites(self, search_terms):
+        """Exact lookup of several sites at once: {name: (eNodeBID, Sub Region, match count)}"""
+        # The cache keeps one row per eNodeB Name, so an exact hit always counts 1
+        placeholders = ", ".join("?" * len(search_terms))
+        rows = self.conn.execute(self.EXACT_LOOKUP_SQL.format(placeholders), search_terms)
+        return {name: (enodeb_id, region, 1) for name, enodeb_id, region in rows}
+    
+    def query_site(self, search_term):
+        """Partial lookup of one site: (eNodeBID, Sub Region, match count), or None"""
+        return self.conn.execute(self.PARTIAL_LOOKUP_SQL, (search_term,)).fetchone()
+    
     def get_cache_metadata(self):
-        """Get metadata from cache"""
+        """Get metadata from the cache's JSON sidecar"""
         try:
-            conn = sqlite3.connect(self.cache_db_path)
-            cursor = conn.cursor()
-            cursor.execute("SELECT source_file, import_date, record_count FROM metadata")
-            result = cursor.fetchone()
-            conn.close()
-            return result
-        except:
+            return json.loads(self.meta_path.read_text())
+        except Exception:
             return None
     
     def auto_load_cache(self):
@@ -601,24 +972,27 @@ class CachedSiteLookup(QMainWindow):
             self.add_log("Loading from cache...", "INFO")
             self.update_status_led("yellow", "Loading cache...")
             
-            # Load from SQLite
-            conn = sqlite3.connect(self.cache_db_path)
-            self.df = pd.read_sql_query("SELECT * FROM sites", conn)
+            # Open the cache for indexed lookups; rows stay on disk
+            self.open_cache()
             
             # Get metadata
             metadata = self.get_cache_metadata()
             if metadata:
-                source_file, import_date, record_count = metadata
+                source_file = metadata['source_file']
+                import_date = metadata['import_date']
+                record_count = metadata['record_count']
                 self.database_path = source_file
                 self.add_log(f"Cache loaded: {record_count:,} records", "SUCCESS")
                 self.add_log(f"Source: {Path(source_file).name}", "DEBUG")
                 self.add_log(f"Cached: {import_date}", "DEBUG")
                 
-                # Check if source file still exists and is newer
+                # Check if source file still exists and has changed: size first, then (only
+                # for a newer mtime) a fingerprint, so a mere touch does not flag the cache
                 if os.path.exists(source_file):
-                    source_mtime = os.path.getmtime(source_file)
-                    cache_mtime = os.path.getmtime(self.cache_db_path)
-                    if source_mtime > cache_mtime:
+                    source_changed = os.path.getsize(source_file) != metadata['source_size']
+                    if not source_changed and os.path.getmtime(source_file) > os.path.getmtime(self.cache_db_path):
+                        source_changed = source_fingerprint(source_file) != metadata['source_fingerprint']
+                    if source_changed:
                         self.add_log("⚠ Source file has been updated!", "WARNING")
                         self.update_status_led("yellow", f"Cache outdated - {record_count:,} records")
                         self.cache_indicator.setVisible(True)
@@ -633,55 +1007,16 @@ class CachedSiteLookup(QMainWindow):
                     self.cache_indicator.setVisible(True)
                     self.cache_indicator.setToolTip("Using cached data (source file moved)")
             
-            conn.close()
-            
             self.search_input.setEnabled(True)
             self.search_count = 0
             self.setWindowTitle(f" Site Lookup - {Path(source_file).name if metadata else 'Cached'}")
             
         except Exception as e:
+            self.close_cache()
             self.add_log(f"Failed to load cache: {str(e)}", "ERROR")
             self.update_status_led("red", "Cache load failed")
             self.cache_indicator.setVisible(False)
     
-    def save_to_cache(self, source_file):
-        """Save dataframe to SQLite cache"""
-        try:
-            self.add_log("Saving to cache...", "INFO")
-            
-            # Create SQLite database
-            conn = sqlite3.connect(self.cache_db_path)
-            
-            # Save data
-            self.df.to_sql('sites', conn, if_exists='replace', index=False)
-            
-            # Save metadata
-            cursor = conn.cursor()
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS metadata (
-                    source_file TEXT,
-                    import_date TEXT,
-                    record_count INTEGER
-                )
-            """)
-            cursor.execute("DELETE FROM metadata")
-            cursor.execute("""
-                INSERT INTO metadata VALUES (?, ?, ?)
-            """, (source_file, datetime.now().strftime("%Y-%m-%d %H:%M:%S"), len(self.df)))
-            
-            # Create index for faster searches
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_enodeb_name ON sites ([eNodeB Name])")
-            
-            conn.commit()
-            conn.close()
-            
-            self.add_log(f"Cache saved: {len(self.df):,} records", "SUCCESS")
-            self.cache_indicator.setVisible(True)
-            self.cache_indicator.setToolTip(f"Cache created: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-            
-        except Exception as e:
-            self.add_log(f"Failed to save cache: {str(e)}", "ERROR")
-    
     def load_database_from_file(self):
         """Load database from file and cache it"""
         self.add_log("Opening file dialog", "INFO")
@@ -709,68 +1044,67 @@ class CachedSiteLookup(QMainWindow):
         self.load_and_cache_database(self.database_path)
     
     def load_and_cache_database(self, file_path):
-        """Load database from file and save to cache"""
+        """Load database from file and save to cache, on a worker thread"""
+        if self.load_thread is not None:
+            return
+        
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
         self.load_btn.setEnabled(False)
         self.search_input.setEnabled(False)
         self.update_status_led("yellow", "Loading...")
+        self.update_progress(10, "Reading file")
+        
+        # The cache is rebuilt under the search connection, so release it first
+        self.close_cache()
+        
+        self.load_thread = CacheLoadThread(file_path, self.cache_db_path, self.meta_path)
+        self.load_thread.progress.connect(self.update_progress)
+        self.load_thread.log.connect(self.add_log)
+        self.load_thread.missing_columns.connect(self.load_validation_failed)
+        self.load_thread.finished.connect(self.load_finished)
+        self.load_thread.start()
+    
+    def release_load_thread(self):
+        """Wait for the finished load thread and drop it"""
+        # run() returns right after emitting, so this wait is short
+        self.load_thread.wait()
+        self.load_thread.deleteLater()
+        self.load_thread = None
+    
+    def load_validation_failed(self, missing_cols):
+        """Handle a source file without the required columns"""
+        self.release_load_thread()
+        self.add_log(f"Missing columns: {', '.join(missing_cols)}", "ERROR")
+        self.update_progress(0, "Failed")
+        QTimer.singleShot(1000, lambda: self.progress_bar.setVisible(False))
+        self.load_btn.setEnabled(True)
+        self.update_status_led("red", "Validation failed")
+        QMessageBox.warning(self, "Missing Columns",
+                          f"Required columns not found:\n{', '.join(missing_cols)}")
+    
+    def load_finished(self, success, message):
+        """Open the rebuilt cache for searching, or report the load error"""
+        file_path = self.load_thread.file_path
+        self.release_load_thread()
         
         try:
-            filename = file_path.split('/')[-1].split('\\')[-1]
-            self.update_progress(10, "Reading file")
-            self.add_log(f"Loading: {filename}", "INFO")
-            
-            if file_path.endswith('.csv'):
-                self.update_progress(25, "Parsing CSV")
-                self.df = pd.read_csv(file_path, encoding='utf-8', on_bad_lines='skip')
-            else:
-                self.update_progress(25, "Parsing Excel")
-                self.df = pd.read_excel(file_path, engine='openpyxl')
-            
-            self.update_progress(50, "Processing data")
-            self.add_log(f"Loaded {len(self.df):,} rows", "INFO")
-            
-            # Verify columns
-            self.update_progress(60, "Validating")
-            required_cols = ['eNodeB Name', 'eNodeBID', 'Sub Region']
-            missing_cols = [col for col in required_cols if col not in self.df.columns]
-            
-            if missing_cols:
-                self.add_log(f"Missing columns: {', '.join(missing_cols)}", "ERROR")
-                self.update_progress(0, "Failed")
-                QTimer.singleShot(1000, lambda: self.progress_bar.setVisible(False))
-                self.load_btn.setEnabled(True)
-                self.update_status_led("red", "Validation failed")
-                QMessageBox.warning(self, "Missing Columns",
-                                  f"Required columns not found:\n{', '.join(missing_cols)}")
-                self.df = None
-                return
-            
-            self.update_progress(70, "Cleaning data")
-            initial_count = len(self.df)
-            self.df = self.df.dropna(subset=['eNodeB Name'])
-            removed = initial_count - len(self.df)
-            if removed > 0:
-                self.add_log(f"Removed {removed} null records", "WARNING")
-            
-            self.df['eNodeB Name'] = self.df['eNodeB Name'].astype(str).str.strip().str.upper()
-            self.df['eNodeBID'] = self.df['eNodeBID'].astype(str).str.strip()
-            self.df['Sub Region'] = self.df['Sub Region'].astype(str).str.strip()
+            if not success:
+                raise RuntimeError(message)
             
-            # Save to cache
-            self.update_progress(85, "Caching")
-            self.save_to_cache(file_path)
+            self.open_cache()
+            self.cache_indicator.setVisible(True)
+            self.cache_indicator.setToolTip(f"Cache created: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
             
             # Complete
             self.database_path = file_path
             self.search_count = 0
             self.update_progress(100, "Complete")
-            self.add_log(f"Database ready: {len(self.df):,} records", "SUCCESS")
+            self.add_log(f"Database ready: {self.record_count:,} records", "SUCCESS")
             
             self.search_input.setEnabled(True)
-            self.update_status_led("green", f"Ready: {len(self.df):,} records (cached)")
-            self.setWindowTitle(f"Site Lookup - {filename}")
+            self.update_status_led("green", f"Ready: {self.record_count:,} records (cached)")
+            self.setWindowTitle(f"Site Lookup - {Path(file_path).name}")
             
             self.clear_results()
             QTimer.singleShot(100, self.focus_search)
@@ -785,7 +1119,6 @@ class CachedSiteLookup(QMainWindow):
             self.search_input.setEnabled(False)
             self.update_status_led("red", "Load failed")
             QMessageBox.critical(self, "Error", f"Failed to load database:\n\n{str(e)}")
-            self.df = None
             self.setWindowTitle("Site Lookup")
     
     def show_cache_info(self):
@@ -797,7 +1130,9 @@ class CachedSiteLookup(QMainWindow):
         try:
             metadata = self.get_cache_metadata()
             if metadata:
-                source_file, import_date, record_count = metadata
+                source_file = metadata['source_file']
+                import_date = metadata['import_date']
+                record_count = metadata['record_count']
                 cache_size = self.cache_db_path.stat().st_size / (1024 * 1024)  # MB
                 
                 info = f"""Cache Information:
@@ -833,16 +1168,29 @@ Cache Location:
         
         if reply == QMessageBox.StandardButton.Yes:
             try:
+                self.close_cache()
                 os.remove(self.cache_db_path)
+                self.meta_path.unlink(missing_ok=True)
+                for suffix in ("-wal", "-shm"):
+                    Path(f"{self.cache_db_path}{suffix}").unlink(missing_ok=True)
                 self.add_log("Cache cleared", "INFO")
                 self.cache_indicator.setVisible(False)
+                self.search_input.setEnabled(False)
+                self.update_status_led("red", "No database loaded")
                 QMessageBox.information(self, "Cache Cleared", "Cache has been cleared successfully.")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to clear cache:\n\n{str(e)}")
     
+    def closeEvent(self, event):
+        """Release the cache connection when the window closes"""
+        if self.load_thread is not None:
+            self.load_thread.wait()
+        self.close_cache()
+        super().closeEvent(event)
+    
     def handle_search(self):
-        """Handle search - supports multiple space-separated site names"""
-        if self.df is None:
+        """Handle search - supports multiple site names separated by spaces, commas, pipes or OR"""
+        if self.conn is None:
             self.add_log("No database loaded", "ERROR")
             QMessageBox.warning(self, "No Database", "Please load a database first.")
             return
@@ -851,14 +1199,14 @@ Cache Location:
         if not search_text:
             return
         
-        # Split input by spaces to support multiple sites
-        search_terms = [term.strip() for term in search_text.split() if term.strip()]
+        # Split input to support multiple sites
+        search_terms = [term for term in self.SPLIT_RE.split(search_text) if term]
         
         if not search_terms:
             return
         
         self.search_count += 1
-        self.search_count_label.setText(str(self.search_count))
+        self.status_timer.start()
         
         if len(search_terms) == 1:
             self.add_log(f"Search #{self.search_count}: '{search_terms[0]}'", "INFO")
@@ -870,59 +1218,73 @@ Cache Location:
         found_count = 0
         not_found_count = 0
         
+        # Convert 4LRD to 6LRD
+        lookup_terms = [
+            '6' + search_term[1:] if len(search_term) >= 5 and search_term[0] == '4' else search_term
+            for search_term in search_terms
+        ]
+        converted = [
+            f"{original} → {term}" for original, term in zip(search_terms, lookup_terms) if original != term
+        ]
+        if converted:
+            if self.log_details:
+                self.add_log(f"Converted: {', '.join(converted)}", "INFO")
+            else:
+                self.add_log(f"Converted {len(converted)} term(s) (4LRD → 6LRD)", "INFO")
+        
+        # Exact match first, then partial (memoized per cache connection)
+        try:
+            lookups = self.lookup_sites(lookup_terms)
+        except Exception as e:
+            lookups = {}
+            self.add_log(f"Search error: {str(e)}", "ERROR")
+        
         # Process each search term in order
-        for search_term in search_terms:
-            # Convert 4LRD to 6LRD
-            original_term = search_term
-            if len(search_term) >= 5 and search_term[0] == '4':
-                search_term = '6' + search_term[1:]
-                self.add_log(f"Converted: {original_term} → {search_term}", "INFO")
-            
+        for original_term, search_term in zip(search_terms, lookup_terms):
             try:
-                # Exact match first
-                result = self.df[self.df['eNodeB Name'].str.upper() == search_term]
-                match_type = "exact"
+                result, match_type = lookups[search_term]
                 
-                # Partial match if no exact match
-                if result.empty:
-                    result = self.df[self.df['eNodeB Name'].str.upper().str.contains(search_term, na=False)]
-                    match_type = "partial"
-                
-                if not result.empty:
-                    enodeb_id = result.iloc[0]['eNodeBID']
-                    region = result.iloc[0]['Sub Region']
+                if result is not None:
+                    enodeb_id, region, match_count = result
                     
                     enodeb_results.append(str(enodeb_id))
                     region_results.append(str(region))
                     
                     found_count += 1
                     
-                    if len(result) > 1:
-                        self.add_log(f"✓ {original_term}: {enodeb_id} | {region} ({len(result)} matches, showing first)", "SUCCESS")
-                    else:
+                    if self.log_details and match_count > 1:
+                        self.add_log(f"✓ {original_term}: {enodeb_id} | {region} ({match_count} matches, showing first)", "SUCCESS")
+                    elif self.log_details:
                         self.add_log(f"✓ {original_term}: {enodeb_id} | {region} ({match_type})", "SUCCESS")
                     
                 else:
                     enodeb_results.append("Not Found")
                     region_results.append("Not Found")
                     not_found_count += 1
-                    self.add_log(f"✗ {original_term}: No match found", "WARNING")
+                    if self.log_details:
+                        self.add_log(f"✗ {original_term}: No match found", "WARNING")
                 
-            except Exception as e:
+            except KeyError:
+                # The lookup itself failed; already logged above
                 enodeb_results.append("Error")
                 region_results.append("Error")
-                self.add_log(f"Search error for '{original_term}': {str(e)}", "ERROR")
         
-        # Format results with aligned pipelines for visual pairing
-        # Calculate the width needed for each pair (max of ID and Region length)
-        pair_widths = []
-        for i in range(len(enodeb_results)):
-            max_width = max(len(str(enodeb_results[i])), len(str(region_results[i])))
-            pair_widths.append(max_width)
+        if not_found_count:
+            not_found = [term for term, enodeb_id in zip(search_terms, enodeb_results) if enodeb_id == "Not Found"]
+            self.add_log(f"Found {found_count}/{len(search_terms)} - no match: {' '.join(not_found)}", "WARNING")
+        elif found_count:
+            self.add_log(f"Found {found_count}/{len(search_terms)}", "SUCCESS")
         
-        # Pad each result to its pair width for alignment
-        padded_enodeb = [str(enodeb_results[i]).ljust(pair_widths[i]) for i in range(len(enodeb_results))]
-        padded_region = [str(region_results[i]).ljust(pair_widths[i]) for i in range(len(region_results))]
+        self.add_log(f"Lookup cache: {self.search_cache_hits} hits, {self.search_cache_misses} misses", "DEBUG")
+        
+        # Format results with aligned pipelines for visual pairing:
+        # pad each ID and Region to the wider of the two
+        padded_enodeb = []
+        padded_region = []
+        for enodeb_id, region in zip(enodeb_results, region_results):
+            width = max(len(enodeb_id), len(region))
+            padded_enodeb.append(f"{enodeb_id:<{width}}")
+            padded_region.append(f"{region:<{width}}")
         
         # Display with pipeline separator between pairs
         self.enodeb_value.setText(" | ".join(padded_enodeb))
@@ -938,6 +1300,10 @@ Cache Location:
         
         self.clear_btn.setEnabled(True)
         self.search_input.selectAll()
+        
+        # The whole search is logged; write it out in one insert now rather than on the timer
+        self.log_timer.stop()
+        self.flush_log()
 
 def main():
     QApplication.setHighDpiScaleFactorRoundingPolicy(Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)
@@ -40,6 +40,10 @@ import re
 import os
 import sys
 
+# Separators between pasted values, and a 5-8 digit hex ECI (7 digits is standard)
+VALUE_SPLIT_RE = re.compile(r'[,\s\n\r\t]+')
+ECI_RE = re.compile(r'^[0-9A-F]{5,8}$')
+
 class ColoredButton(tk.Canvas):
     """Custom button widget that matches ttk button appearance but with custom colors"""
     def __init__(self, parent, text, command, bg_color='#006400', fg_color='white', **kwargs):
@@ -117,6 +121,7 @@ class StreamingQueryGenerator:
 
         # Store selected ECIs
         self.selected_ecis = []
+        self.selected_eci_set = set()  # Same ECIs, for O(1) duplicate checks
         
         # Cell name to eNodeB_ID mapping dictionary
         self.cell_mapping = {}  # Format: {'AKOIM_1': 110345, 'AKOIM_2': 110345, ...}
@@ -553,7 +558,10 @@ class StreamingQueryGenerator:
         """Load mapping from specified file"""
         try:
             import csv
+            # Both lookups are rebuilt from the new file; stale eNodeB names would otherwise
+            # shadow the new IDs (the first mapping for a name wins)
             self.cell_mapping.clear()
+            self.enodeb_mapping.clear()
             loaded_count = 0
             
             # Determine file type and load accordingly
@@ -563,14 +571,10 @@ class StreamingQueryGenerator:
                     sample = f.read(1024)
                     f.seek(0)
                     
-                    # Check for common delimiters
-                    if '\t' in sample:
-                        delimiter = '\t'
-                    elif ',' in sample:
-                        delimiter = ','
-                    elif ';' in sample:
-                        delimiter = ';'
-                    else:
+                    # Let the csv module pick among the common delimiters (honours quoting)
+                    try:
+                        delimiter = csv.Sniffer().sniff(sample, delimiters=',\t;').delimiter
+                    except csv.Error:
                         delimiter = ','
                     
                     reader = csv.reader(f, delimiter=delimiter)
@@ -584,18 +588,10 @@ class StreamingQueryGenerator:
                         
                         if not is_header:
                             # Process first row if it's not a header
-                            try:
-                                loaded_count += self._process_mapping_row(first_row)
-                            except (ValueError, IndexError):
-                                pass
+                            loaded_count += self._process_mapping_rows([first_row])
                     
-                    # Process remaining rows
-                    for row in reader:
-                        if len(row) >= 2:
-                            try:
-                                loaded_count += self._process_mapping_row(row)
-                            except (ValueError, IndexError):
-                                continue
+                    # Process remaining rows in one pass
+                    loaded_count += self._process_mapping_rows(reader)
             
             elif filename.endswith('.xlsx'):
                 # For Excel files, try to use pandas or openpyxl
@@ -603,12 +599,10 @@ class StreamingQueryGenerator:
                     import pandas as pd
                     df = pd.read_excel(filename)
                     
-                    for _, row in df.iterrows():
-                        try:
-                            row_list = [str(cell).strip() for cell in row.tolist()]
-                            loaded_count += self._process_mapping_row(row_list)
-                        except (ValueError, IndexError):
-                            continue
+                    # Plain tuples rather than a Series per row
+                    loaded_count += self._process_mapping_rows(
+                        [str(cell).strip() for cell in row] for row in df.itertuples(index=False, name=None)
+                    )
                 except ImportError:
                     self.status_var.set("Error: pandas library not installed. Please use CSV format.")
                     return
@@ -626,8 +620,8 @@ class StreamingQueryGenerator:
             self.mapping_status.config(text="Error loading file", foreground='red')
             self.status_var.set(f"Error loading mapping file: {str(e)}")
     
-    def _process_mapping_row(self, row):
-        """Process a single mapping row and add entries to cell_mapping and enodeb_mapping
+    def _process_mapping_rows(self, rows):
+        """Process mapping rows and add entries to cell_mapping and enodeb_mapping
         
         Supports multiple formats:
         - 5-column format: 4LRD, 5LRD, eNodeB Name, Sector ID, eNodeB ID
@@ -635,39 +629,43 @@ class StreamingQueryGenerator:
           - Column 3 (Sector ID) maps to eNodeB ID for Sector ID lookup
         - 2-column format: Sector ID, eNodeB ID
         
-        Maps both Sector ID and eNodeB Name to eNodeB ID
+        Maps both Sector ID and eNodeB Name to eNodeB ID. Rows that do not parse are skipped.
+        Returns the number of Sector ID mappings added.
         """
+        cell_mapping = self.cell_mapping
+        enodeb_mapping = self.enodeb_mapping
+        blank = ('', 'NAN')  # Empty cells, and NaN as written out by pandas/Excel
         count = 0
         
-        try:
-            if len(row) >= 5:
-                # 5-column format: col0=4LRD, col1=5LRD, col2=eNodeB Name, col3=Sector ID, col4=eNodeB ID
-                enodeb_name = row[2].strip().upper()
-                sector_id = row[3].strip().upper()
-                enodeb_id = int(row[4])
-                
-                # Add Sector ID mapping
-                if sector_id and sector_id != 'NAN' and enodeb_id >= 0:
-                    self.cell_mapping[sector_id] = enodeb_id
-                    count += 1
-                
-                # Add eNodeB Name mapping (Column C)
-                if enodeb_name and enodeb_name != 'NAN' and enodeb_id >= 0:
-                    # Store in enodeb_mapping directly
-                    if enodeb_name not in self.enodeb_mapping:
-                        self.enodeb_mapping[enodeb_name] = enodeb_id
-                        
-            elif len(row) >= 2:
-                # 2-column format: col0=Sector ID, col1=eNodeB ID
-                sector_id = row[0].strip().upper()
-                enodeb_id = int(row[1])
-                
-                if sector_id and sector_id != 'NAN' and enodeb_id >= 0:
-                    self.cell_mapping[sector_id] = enodeb_id
-                    count += 1
-        
-        except (ValueError, IndexError):
-            pass
+        for row in rows:
+            try:
+                if len(row) >= 5:
+                    # 5-column format: col0=4LRD, col1=5LRD, col2=eNodeB Name, col3=Sector ID, col4=eNodeB ID
+                    enodeb_name = row[2].strip().upper()
+                    sector_id = row[3].strip().upper()
+                    enodeb_id = int(row[4])
+                elif len(row) >= 2:
+                    # 2-column format: col0=Sector ID, col1=eNodeB ID
+                    enodeb_name = ''
+                    sector_id = row[0].strip().upper()
+                    enodeb_id = int(row[1])
+                else:
+                    continue
+            except ValueError:
+                continue
+            
+            # One set of checks for both formats
+            if enodeb_id < 0:
+                continue
+            
+            # Add Sector ID mapping
+            if sector_id not in blank:
+                cell_mapping[sector_id] = enodeb_id
+                count += 1
+            
+            # Add eNodeB Name mapping (Column C), first occurrence wins
+            if enodeb_name not in blank:
+                enodeb_mapping.setdefault(enodeb_name, enodeb_id)
         
         return count
     
@@ -692,7 +690,7 @@ class StreamingQueryGenerator:
     def build_enodeb_mapping(self):
         """Build eNodeB name to ID mapping from cell_mapping.
         This is called after loading the mapping file to ensure we have both:
-        1. Direct mappings from Column C (eNodeB Name) - already loaded in _process_mapping_row
+        1. Direct mappings from Column C (eNodeB Name) - already loaded in _process_mapping_rows
         2. Fallback mappings from Sector ID prefix (for backward compatibility)"""
         
         # Add fallback mappings from Sector ID prefixes if eNodeB Name wasn't in the file
@@ -725,7 +723,7 @@ class StreamingQueryGenerator:
             return
         
         # Split by common delimiters (comma, space, newline, tab)
-        raw_values = re.split(r'[,\s\n\r\t]+', input_text)
+        raw_values = VALUE_SPLIT_RE.split(input_text)
         
         added = 0
         skipped = 0
@@ -760,12 +758,13 @@ class StreamingQueryGenerator:
                 hex_results.append(f"{value_str} -> {hex_value}")
                 
                 # Check if already in list
-                if hex_value in self.selected_ecis:
+                if hex_value in self.selected_eci_set:
                     skipped += 1
                     continue
                 
                 # Add to ECI list
                 self.selected_ecis.append(hex_value)
+                self.selected_eci_set.add(hex_value)
                 added += 1
                 
             except ValueError:
@@ -813,7 +812,7 @@ class StreamingQueryGenerator:
             return
         
         # Split by common delimiters
-        raw_values = re.split(r'[,\s\n\r\t]+', input_text)
+        raw_values = VALUE_SPLIT_RE.split(input_text)
         
         added = 0
         skipped = 0
@@ -866,12 +865,13 @@ class StreamingQueryGenerator:
                 hex_results.append(f"{sector_id} -> {hex_value} (eNB:{enodeb_id}={enodeb_hex}, Cell:{sector_number}={cell_hex})")
                 
                 # Check if already in list
-                if hex_value in self.selected_ecis:
+                if hex_value in self.selected_eci_set:
                     skipped += 1
                     continue
                 
                 # Automatically add to ECI list
                 self.selected_ecis.append(hex_value)
+                self.selected_eci_set.add(hex_value)
                 added += 1
             else:
                 not_found += 1
@@ -925,7 +925,7 @@ class StreamingQueryGenerator:
             return
         
         # Split by common delimiters
-        raw_values = re.split(r'[,\s\n\r\t]+', input_text)
+        raw_values = VALUE_SPLIT_RE.split(input_text)
         
         added = 0
         skipped = 0
@@ -955,13 +955,14 @@ class StreamingQueryGenerator:
                 enodeb_hex = format(enodeb_id, '05X')
                 
                 # Check if already in list
-                if enodeb_hex in self.selected_ecis:
+                if enodeb_hex in self.selected_eci_set:
                     hex_results.append(f"{enodeb_name} -> {enodeb_hex} (eNB:{enodeb_id}) [Already in list - includes ALL cells]")
                     skipped += 1
                     continue
                 
                 # Add only the 5-digit eNodeB hex (this includes all cells)
                 self.selected_ecis.append(enodeb_hex)
+                self.selected_eci_set.add(enodeb_hex)
                 added += 1
                 
                 hex_results.append(f"{enodeb_name} -> {enodeb_hex} (eNB:{enodeb_id}) [Includes ALL cells under this eNodeB]")
@@ -994,15 +995,16 @@ class StreamingQueryGenerator:
         eci = self.eci_entry.get().strip().upper()
         
         # Validate ECI format (7-digit hexadecimal is standard, 5-8 supported)
-        if not re.match(r'^[0-9A-F]{5,8}$', eci):
+        if not ECI_RE.match(eci):
             self.status_var.set("Invalid ECI format. Must be 5-8 digit hexadecimal (standard: 7-digit, e.g., 3F92E02)")
             return
         
-        if eci in self.selected_ecis:
+        if eci in self.selected_eci_set:
             self.status_var.set(f"ECI {eci} already in list")
             return
         
         self.selected_ecis.append(eci)
+        self.selected_eci_set.add(eci)
         self.update_eci_display()
         self.eci_entry.delete(0, tk.END)
         self.status_var.set(f"Added ECI {eci}")
@@ -1013,7 +1015,7 @@ class StreamingQueryGenerator:
             clipboard_text = self.root.clipboard_get()
             
             # Split by common delimiters and clean
-            raw_ecis = re.split(r'[,\s\n\r\t]+', clipboard_text)
+            raw_ecis = VALUE_SPLIT_RE.split(clipboard_text)
             
             added = 0
             skipped = 0
@@ -1025,15 +1027,16 @@ class StreamingQueryGenerator:
                     continue
                 
                 # Validate format (5-8 digit hexadecimal)
-                if not re.match(r'^[0-9A-F]{5,8}$', eci):
+                if not ECI_RE.match(eci):
                     invalid += 1
                     continue
                 
-                if eci in self.selected_ecis:
+                if eci in self.selected_eci_set:
                     skipped += 1
                     continue
                 
                 self.selected_ecis.append(eci)
+                self.selected_eci_set.add(eci)
                 added += 1
             
             self.update_eci_display()
@@ -1053,6 +1056,7 @@ class StreamingQueryGenerator:
     
     def clear_ecis(self):
         self.selected_ecis.clear()
+        self.selected_eci_set.clear()
         self.update_eci_display()
         self.status_var.set("All ECIs cleared")
     
@@ -1089,15 +1093,10 @@ class StreamingQueryGenerator:
                 self.partition_var.set("Error: Start date must be before end date")
                 return
             
-            # Calculate partition numbers
-            partitions = []
-            current = start
-            while current <= end:
-                days_diff = (reference - current).days
-                partitions.append(f"p{days_diff}")
-                current += timedelta(days=1)
-            
-            self.partition_var.set(", ".join(partitions))
+            # Partition number = days before the reference date, counting down from start to end
+            first = (reference - start).days
+            last = (reference - end).days
+            self.partition_var.set(", ".join(f"p{days_diff}" for days_diff in range(first, last - 1, -1)))
             
         except Exception as e:
             self.partition_var.set(f"Error: {str(e)}")